@@ -1,6 +1,14 @@
 # given an array of integers that are out of order, determine the bounds of the smallest window that must be sorted
 # in order for the entire array to be sorted. For example, given [3,7,5,6,9], you should return (1,3)
 
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
 def smallest_window(arr):
     n = len(arr)
     left_bound = n - 1
@@ -40,3 +48,215 @@ def smallest_window(arr):
 # * If the left bound is greater than or equal to the right bound, the array is already sorted, and we return None.
 # * Otherwise, we return a tuple of the left and right bounds of the smallest unsorted subarray.
 #
+
+
+# Parallel version for very large arrays.
+#
+# The right bound is the last i with arr[i] < max(arr[:i]) and the left bound is the first i with
+# arr[i] > min(arr[i + 1:]). Both only depend on what happens inside a chunk plus one carried value from the
+# outside, so the array is split into chunks and processed in two rounds over a process pool:
+#
+# 1. Every worker returns (min, max) of its chunk.
+# 2. The parent turns those into the max of everything before each chunk and the min of everything after it.
+# 3. Every worker scans its chunk with NumPy accumulates against those carried values and returns its first left
+#    violation and its last right violation. The overall bounds are the smallest left and the largest right.
+#
+# Workers never receive a copy of the data: a memmap is reopened from its file, and an in-memory array is inherited
+# by forked workers. Only platforms without fork fall back to sending each chunk to its worker.
+_shared_array = None
+
+
+def smallest_window_parallel(arr, workers=None, chunks_per_worker=4):
+    global _shared_array
+    if not isinstance(arr, np.ndarray):
+        arr = np.asarray(arr)
+    n = len(arr)
+    if n < 2:
+        return smallest_window(arr)
+
+    workers = workers or os.cpu_count() or 1
+    chunk_count = min(n, workers * chunks_per_worker)
+    edges = [n * k // chunk_count for k in range(chunk_count + 1)]
+    ranges = list(zip(edges[:-1], edges[1:]))
+
+    handle, context = _share(arr)
+    _shared_array = arr
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            extremes = list(pool.map(_chunk_extremes, *_task_args(handle, arr, ranges)))
+
+            # reduction: max of all chunks before k and min of all chunks after k
+            before_max = [None]
+            for _, chunk_max in extremes[:-1]:
+                before_max.append(chunk_max if before_max[-1] is None else max(before_max[-1], chunk_max))
+            after_min = [None]
+            for chunk_min, _ in reversed(extremes[1:]):
+                after_min.append(chunk_min if after_min[-1] is None else min(after_min[-1], chunk_min))
+            after_min.reverse()
+
+            bounds = list(pool.map(_chunk_bounds, *_task_args(handle, arr, ranges), before_max, after_min))
+    finally:
+        _shared_array = None
+
+    lefts = [left for left, _ in bounds if left is not None]
+    rights = [right for _, right in bounds if right is not None]
+    if not lefts:
+        return None
+    return min(lefts), max(rights)
+
+
+def _share(arr):
+    if isinstance(arr, np.memmap) and isinstance(arr.base, mmap.mmap) and arr.filename:
+        return ("memmap", arr.filename, arr.dtype.str, arr.offset, arr.shape), None
+    if "fork" in multiprocessing.get_all_start_methods():
+        return ("inherited",), multiprocessing.get_context("fork")
+    return None, None
+
+
+def _task_args(handle, arr, ranges):
+    starts = [start for start, _ in ranges]
+    stops = [stop for _, stop in ranges]
+    if handle is None:
+        # no way to share the buffer, ship each chunk on its own and index it from 0
+        chunks = [arr[start:stop] for start, stop in ranges]
+        return chunks, starts, [0] * len(ranges), [len(chunk) for chunk in chunks]
+    return [handle] * len(ranges), starts, starts, stops
+
+
+def _open(handle):
+    if isinstance(handle, np.ndarray):
+        return handle
+    if handle[0] == "memmap":
+        _, filename, dtype, offset, shape = handle
+        return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=shape)
+    return _shared_array
+
+
+def _chunk_extremes(handle, _base, start, stop):
+    chunk = _open(handle)[start:stop]
+    return _to_python(chunk.min()), _to_python(chunk.max())
+
+
+def _to_python(value):
+    # object arrays (Python ints beyond int64) already hold Python values, which have no .item()
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _chunk_bounds(handle, base, start, stop, before_max, after_min):
+    chunk = _open(handle)[start:stop]
+
+    # max of everything strictly before each element
+    running_max = np.maximum.accumulate(chunk)
+    prev_max = np.empty_like(chunk)
+    prev_max[1:] = running_max[:-1]
+    prev_max[0] = chunk[0] if before_max is None else before_max
+    if before_max is not None:
+        np.maximum(prev_max, before_max, out=prev_max)
+
+    # min of everything strictly after each element
+    running_min = np.minimum.accumulate(chunk[::-1])[::-1]
+    next_min = np.empty_like(chunk)
+    next_min[:-1] = running_min[1:]
+    next_min[-1] = chunk[-1] if after_min is None else after_min
+    if after_min is not None:
+        np.minimum(next_min, after_min, out=next_min)
+
+    right = np.flatnonzero(chunk < prev_max)
+    left = np.flatnonzero(chunk > next_min)
+    return (
+        base + int(left[0]) if len(left) else None,
+        base + int(right[-1]) if len(right) else None,
+    )
+
+
+# Incremental version for arrays that keep changing.
+#
+# A segment tree keeps, for every node, the max and min of its range and whether the range is out of order. A range
+# is out of order when either half is, or when the min of the right half is below the max of the left half, so a
+# point change only has to recompute the O(log n) nodes above it.
+#
+# bounds() then walks down from the root once per side. Looking for the right bound, it prefers the right child and
+# carries the max of everything to the left of the current node: the right child holds a violation exactly when it is
+# out of order itself or its min is below that carried max. The left bound is the mirror image with a carried min.
+# Appends go into spare leaves, and the tree doubles its capacity when it is full, so they are amortized O(log n).
+class SortedWindowTracker:
+    def __init__(self, arr=()):
+        self._build(list(arr))
+
+    def _build(self, values):
+        self._n = len(values)
+        self._size = 1
+        while self._size < max(self._n, 1):
+            self._size *= 2
+        # unused leaves are +inf, which never breaks the order of what comes before them
+        self._max = [float("inf")] * (2 * self._size)
+        self._min = [float("inf")] * (2 * self._size)
+        self._bad = [False] * (2 * self._size)
+        self._max[self._size:self._size + self._n] = values
+        self._min[self._size:self._size + self._n] = values
+        for node in range(self._size - 1, 0, -1):
+            self._pull(node)
+
+    def _pull(self, node):
+        left, right = 2 * node, 2 * node + 1
+        self._max[node] = max(self._max[left], self._max[right])
+        self._min[node] = min(self._min[left], self._min[right])
+        self._bad[node] = self._bad[left] or self._bad[right] or self._min[right] < self._max[left]
+
+    def _set(self, i, value):
+        node = self._size + i
+        self._max[node] = self._min[node] = value
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def __len__(self):
+        return self._n
+
+    def values(self):
+        return self._max[self._size:self._size + self._n]
+
+    def append(self, value):
+        if self._n == self._size:
+            self._build(self.values() + [value])
+        else:
+            self._set(self._n, value)
+            self._n += 1
+
+    def update(self, i, value):
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("SortedWindowTracker index out of range")
+        self._set(i, value)
+
+    def bounds(self):
+        if self._n < 2:
+            return smallest_window(self.values())
+        if not self._bad[1]:
+            return None
+
+        # right bound: rightmost i with arr[i] < max(arr[:i])
+        node, before_max = 1, float("-inf")
+        while node < self._size:
+            left, right = 2 * node, 2 * node + 1
+            right_before_max = max(before_max, self._max[left])
+            if self._bad[right] or self._min[right] < right_before_max:
+                node, before_max = right, right_before_max
+            else:
+                node = left
+        right_bound = node - self._size
+
+        # left bound: leftmost i with arr[i] > min(arr[i + 1:])
+        node, after_min = 1, float("inf")
+        while node < self._size:
+            left, right = 2 * node, 2 * node + 1
+            left_after_min = min(after_min, self._min[right])
+            if self._bad[left] or self._max[left] > left_after_min:
+                node, after_min = left, left_after_min
+            else:
+                node = right
+        left_bound = node - self._size
+
+        return left_bound, right_bound
@@ -2,6 +2,11 @@
 
 # Your solution should have a time complexity of O(n), where n is the length of the input array.
 
+import time
+
+import numpy as np
+
+
 def max_subarray_sum(arr):
     max_sum = arr[0]
     current_sum = arr[0]
@@ -44,3 +49,179 @@ def max_subarray_sum_wrapup(arr):
 # The function now checks for the maximum subarray sum without wrapping around using the original Kadane's algorithm.
 # Then, it calculates the sum of the entire array arr_sum, and checks for the maximum subarray sum with wrapping around
 # by finding the minimum subarray sum. Finally, it returns the maximum of the two sums.
+
+
+# Single pass version that also reports where the subarray is.
+#
+# Kadane for the max and for the min subarray run side by side in one loop together with the total, and both keep
+# the index where their current run started. The result is (sum, start, end) with end inclusive. With wrap=True the
+# wrapped candidate is total - min_sum, i.e. everything except the min subarray, which starts right after the min
+# subarray and ends right before it, so start > end means the subarray wraps around. Unlike max_subarray_sum_wrapup,
+# the complement of the whole array (the empty subarray) is never returned: for an all negative array the answer is
+# the largest element, not 0.
+#
+# Ties keep the earliest end and, for that end, the earliest start.
+def max_subarray_sum_indices(arr, wrap=False):
+    n = len(arr)
+    max_sum = current_max = min_sum = current_min = total = arr[0]
+    max_start = max_end = current_max_start = 0
+    min_start = min_end = current_min_start = 0
+
+    for i in range(1, n):
+        x = arr[i]
+        total += x
+
+        if current_max < 0:
+            current_max = x
+            current_max_start = i
+        else:
+            current_max += x
+        if current_max > max_sum:
+            max_sum, max_start, max_end = current_max, current_max_start, i
+
+        if current_min > 0:
+            current_min = x
+            current_min_start = i
+        else:
+            current_min += x
+        if current_min < min_sum:
+            min_sum, min_start, min_end = current_min, current_min_start, i
+
+    if wrap and (min_start, min_end) != (0, n - 1) and total - min_sum > max_sum:
+        return total - min_sum, (min_end + 1) % n, (min_start - 1) % n
+    return max_sum, max_start, max_end
+
+
+# Batched version for many rows of the same length, with no Python loop over elements.
+#
+# With prefix sums P (P[0] = 0), the best subarray ending at j is P[j + 1] - min(P[0..j]), so one cumsum, one
+# running minimum and one argmax give every row's sum and end at once. The start is the first position of that
+# minimum, which is exactly where Kadane's current run started, so the indices agree with max_subarray_sum_indices.
+# The wrapped case runs the same thing on the negated rows to find the min subarray.
+#
+# Returns three arrays: sums, starts and ends.
+def max_subarray_sum_batch(rows, wrap=False):
+    rows = np.asarray(rows)
+    if rows.ndim == 1:
+        rows = rows[np.newaxis]
+    sums, starts, ends, total = _max_subarray_prefix(rows)
+    if not wrap:
+        return sums, starts, ends
+
+    n = rows.shape[1]
+    neg_min_sums, min_starts, min_ends, _ = _max_subarray_prefix(-rows)
+    wrapped = total + neg_min_sums
+    use_wrap = ~((min_starts == 0) & (min_ends == n - 1)) & (wrapped > sums)
+    return (
+        np.where(use_wrap, wrapped, sums),
+        np.where(use_wrap, (min_ends + 1) % n, starts),
+        np.where(use_wrap, (min_starts - 1) % n, ends),
+    )
+
+
+def _max_subarray_prefix(rows):
+    m, n = rows.shape
+    prefix = np.zeros((m, n + 1), dtype=np.result_type(rows.dtype, np.int64))
+    np.cumsum(rows, axis=1, out=prefix[:, 1:])
+
+    lowest = np.minimum.accumulate(prefix[:, :-1], axis=1)
+    gains = prefix[:, 1:] - lowest
+    ends = gains.argmax(axis=1)
+    sums = gains[np.arange(m), ends]
+
+    # first position of the lowest prefix at or before each row's end
+    before_end = np.arange(n) <= ends[:, np.newaxis]
+    starts = np.where(before_end, prefix[:, :-1] == lowest[np.arange(m), ends][:, np.newaxis], False).argmax(axis=1)
+    return sums, starts, ends, prefix[:, -1]
+
+
+# Range queries over a fixed array.
+#
+# Every segment tree node stores (total, best prefix, best suffix, best) of its range. Two neighbouring ranges combine
+# in O(1): the best subarray is in the left part, in the right part, or is the left suffix followed by the right
+# prefix. Building bottom-up is O(n), and query(l, r) combines the O(log n) nodes that cover [l, r] (both inclusive),
+# so it never copies a slice. update(i, value) recomputes the nodes above i.
+class MaxSubarrayIndex:
+    def __init__(self, arr):
+        self._n = len(arr)
+        self._size = 1
+        while self._size < max(self._n, 1):
+            self._size *= 2
+        self._tree = [None] * (2 * self._size)
+        for i, x in enumerate(arr):
+            self._tree[self._size + i] = (x, x, x, x)
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = _combine(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def __len__(self):
+        return self._n
+
+    def update(self, i, value):
+        if not 0 <= i < self._n:
+            raise IndexError("MaxSubarrayIndex index out of range")
+        node = self._size + i
+        self._tree[node] = (value, value, value, value)
+        node //= 2
+        while node:
+            self._tree[node] = _combine(self._tree[2 * node], self._tree[2 * node + 1])
+            node //= 2
+
+    def query(self, l, r):
+        if not 0 <= l <= r < self._n:
+            raise IndexError(f"invalid range [{l}, {r}] for {self._n} elements")
+        left = right = None
+        lo, hi = l + self._size, r + self._size + 1
+        while lo < hi:
+            if lo & 1:
+                left = _combine(left, self._tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = _combine(self._tree[hi], right)
+            lo //= 2
+            hi //= 2
+        return _combine(left, right)[3]
+
+
+def _combine(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    a_total, a_prefix, a_suffix, a_best = a
+    b_total, b_prefix, b_suffix, b_best = b
+    return (
+        a_total + b_total,
+        max(a_prefix, a_total + b_prefix),
+        max(b_suffix, b_total + a_suffix),
+        max(a_best, b_best, a_suffix + b_prefix),
+    )
+
+
+def _best_of(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(rows=1000, sizes=(10, 100, 1000, 10000)):
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        data = rng.integers(-100, 100, size=(rows, n))
+        as_lists = data.tolist()
+        timings = {
+            "max_subarray_sum": _best_of(lambda: [max_subarray_sum(row) for row in as_lists]),
+            "max_subarray_sum_wrapup": _best_of(lambda: [max_subarray_sum_wrapup(row) for row in as_lists]),
+            "max_subarray_sum_indices": _best_of(lambda: [max_subarray_sum_indices(row, True) for row in as_lists]),
+            "max_subarray_sum_batch": _best_of(max_subarray_sum_batch, data, True),
+        }
+        print(f"{rows} rows x {n:>6}: " + "  ".join(f"{name} {seconds:.4f}s" for name, seconds in timings.items()))
+
+
+if __name__ == '__main__':
+    print(max_subarray_sum_indices([34, -50, 42, 14, -5, 86]))  # (137, 2, 5)
+    print(max_subarray_sum_indices([8, -1, 3, 4], wrap=True))  # (15, 2, 0)
+    benchmark()
@@ -1,5 +1,12 @@
 # O(nlogn) time complexity
 
+import random
+import time
+from array import array
+from collections import deque
+from itertools import islice
+
+
 def smaller_numbers(nums):
     result = [0] * len(nums)
     pairs = list(enumerate(nums))
@@ -29,7 +36,7 @@ def smaller_numbers(nums):
 
 
 # another method using bisect
-from bisect import bisect_left
+from bisect import bisect_left, insort
 
 
 def smaller_numbers_bisect(nums):
@@ -78,3 +85,216 @@ def smaller_numbers_bisect(nums):
 # sorted_nums: [1, 2, 5, 6]
 #
 # Final result: [2, 1, 1, 0]
+
+
+# third method using a Binary Indexed Tree (Fenwick tree)
+#
+# The values are first compressed to ranks 1..m, so the tree only needs one slot per distinct value and lives in a
+# flat array('i'). Walking from the right, the answer for nums[i] is the number of already seen values with a smaller
+# rank (a prefix sum over the tree), and then nums[i] itself is added at its rank. Both operations are O(log m), the
+# whole run is O(n log n), and nothing is allocated inside the loop. Equal values are not counted, same as the other
+# two methods.
+def smaller_numbers_fenwick(nums):
+    ranks = {num: rank for rank, num in enumerate(sorted(set(nums)), 1)}
+    size = len(ranks)
+    tree = array('i', [0]) * (size + 1)
+    result = [0] * len(nums)
+    for i in range(len(nums) - 1, -1, -1):
+        rank = ranks[nums[i]]
+
+        # count the seen values with rank < rank
+        count = 0
+        j = rank - 1
+        while j:
+            count += tree[j]
+            j &= j - 1
+        result[i] = count
+
+        # add nums[i]
+        j = rank
+        while j <= size:
+            tree[j] += 1
+            j += j & -j
+    return result
+
+
+# fourth method: the merge sort counter again, but bottom-up and without tuples
+#
+# smaller_numbers recurses and slices new lists of (index, value) tuples on every level. Here the runs are merged
+# bottom-up with widths 1, 2, 4, ..., so there is no recursion, and the only buffers are two arrays of indices that are
+# allocated once and swap roles after every level. Values are looked up through nums[index]. The counting rule is the
+# same: when a left element is taken (ties go left, hence <=), every right element already taken is smaller than it.
+def smaller_numbers_iterative(nums):
+    n = len(nums)
+    result = [0] * n
+    src = array('l', range(n))
+    dst = array('l', [0]) * n
+
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                left, right = src[i], src[j]
+                if nums[left] <= nums[right]:
+                    result[left] += j - mid
+                    dst[k] = left
+                    i += 1
+                else:
+                    dst[k] = right
+                    j += 1
+                k += 1
+            while i < mid:
+                left = src[i]
+                result[left] += j - mid
+                dst[k] = left
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+    return result
+
+
+# Pick a method by input size. bisect moves the tail of its sorted list on every insert, which is a fast memmove for
+# short inputs but quadratic overall, so it only wins below a few ten thousand elements.
+ENGINES = {
+    "merge": smaller_numbers,
+    "iterative": smaller_numbers_iterative,
+    "bisect": smaller_numbers_bisect,
+    "fenwick": smaller_numbers_fenwick,
+}
+BISECT_MAX_SIZE = 20000
+
+
+def count_smaller(nums, engine="auto"):
+    if engine == "auto":
+        engine = "bisect" if len(nums) <= BISECT_MAX_SIZE else "fenwick"
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine!r}")
+    return ENGINES[engine](nums)
+
+
+# streaming version: counts for values that arrive one by one
+#
+# mode="sliding": the count for the value at stream position t covers the next window - 1 values, so it is emitted
+# as soon as value t + window - 1 has arrived. The values of the open window sit in a sorted bucket list that supports
+# insert, delete and "how many are smaller" without rebuilding anything.
+# mode="tumbling": the stream is cut into independent batches of window values and every batch is answered with
+# count_smaller once it is full.
+# In both modes the values still open when the stream ends are answered against what is left, and the generator
+# yields (position, count) pairs in position order.
+def smaller_numbers_stream(values, window, mode="sliding"):
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if mode == "sliding":
+        yield from _sliding_smaller_numbers(values, window)
+    elif mode == "tumbling":
+        yield from _tumbling_smaller_numbers(values, window)
+    else:
+        raise ValueError(f"unknown mode: {mode!r}")
+
+
+def _sliding_smaller_numbers(values, window):
+    open_values = deque()
+    sorted_values = _SortedBuckets()
+    position = 0
+    for value in values:
+        open_values.append(value)
+        sorted_values.insert(value)
+        if len(open_values) == window:
+            oldest = open_values.popleft()
+            yield position - window + 1, sorted_values.count_less(oldest)
+            sorted_values.remove(oldest)
+        position += 1
+
+    position -= len(open_values)
+    while open_values:
+        oldest = open_values.popleft()
+        yield position, sorted_values.count_less(oldest)
+        sorted_values.remove(oldest)
+        position += 1
+
+
+def _tumbling_smaller_numbers(values, window):
+    batch = []
+    position = 0
+    for value in values:
+        batch.append(value)
+        if len(batch) == window:
+            yield from enumerate(count_smaller(batch), position)
+            position += window
+            batch = []
+    if batch:
+        yield from enumerate(count_smaller(batch), position)
+
+
+# A sorted multiset split into buckets of a few hundred values. Inserts and deletes only shift one bucket, the right
+# bucket is found by bisecting the bucket maxima, and a rank query adds up the sizes of the buckets before it, which
+# is O(n / LOAD) but much cheaper than touching n values.
+class _SortedBuckets:
+    LOAD = 512
+
+    def __init__(self):
+        self._buckets = []
+        self._maxes = []
+
+    def insert(self, value):
+        if not self._buckets:
+            self._buckets.append([value])
+            self._maxes.append(value)
+            return
+        k = min(bisect_left(self._maxes, value), len(self._buckets) - 1)
+        bucket = self._buckets[k]
+        insort(bucket, value)
+        self._maxes[k] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            self._buckets.insert(k + 1, bucket[self.LOAD:])
+            self._maxes.insert(k + 1, bucket[-1])
+            del bucket[self.LOAD:]
+            self._maxes[k] = bucket[-1]
+
+    def remove(self, value):
+        k = bisect_left(self._maxes, value)
+        bucket = self._buckets[k]
+        del bucket[bisect_left(bucket, value)]
+        if bucket:
+            self._maxes[k] = bucket[-1]
+        else:
+            del self._buckets[k]
+            del self._maxes[k]
+
+    def count_less(self, value):
+        k = bisect_left(self._maxes, value)
+        count = sum(len(bucket) for bucket in islice(self._buckets, k))
+        if k < len(self._buckets):
+            count += bisect_left(self._buckets[k], value)
+        return count
+
+
+# the quadratic or recursion heavy methods stop at their entry in BENCHMARK_MAX_SIZE
+BENCHMARK_MAX_SIZE = {"merge": 10 ** 6, "iterative": 10 ** 6, "bisect": 10 ** 5}
+
+
+def benchmark(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)):
+    rng = random.Random(0)
+    for n in sizes:
+        nums = [rng.randrange(n) for _ in range(n)]
+        timings = []
+        for name, func in ENGINES.items():
+            if n > BENCHMARK_MAX_SIZE.get(name, n):
+                continue
+            start = time.perf_counter()
+            func(nums)
+            timings.append(f"{name} {time.perf_counter() - start:.3f}s")
+        print(f"n={n:>9}  " + "  ".join(timings))
+
+
+if __name__ == '__main__':
+    print(count_smaller([3, 4, 9, 6, 1]))  # [1, 1, 2, 1, 0]
+    benchmark()
@@ -12,7 +12,12 @@
 # Note that the input strings may contain only lowercase English letters, and the length of the pattern p should be
 # less than or equal to the length of s.
 
-from collections import Counter
+import mmap
+import os
+import random
+import string
+import time
+from collections import Counter, defaultdict
 
 
 def find_anagram_indices(s: str, p: str) -> list[int]:
@@ -32,3 +37,162 @@ def find_anagram_indices(s: str, p: str) -> list[int]:
     if p_count == s_count:
         indices.append(len(s) - len(p))
     return indices
+
+
+def find_anagram_indices_fast(s, p):
+    """
+    Same result as find_anagram_indices, but every step of the window costs O(1).
+
+    Instead of comparing two Counters, diff[c] holds "count of c in p minus count of c in the window" and mismatched
+    counts the characters whose diff is not 0, so the window is an anagram exactly when mismatched is 0. Bytes and
+    ASCII strings use a 256-slot list indexed by byte value; other text falls back to a defaultdict with the same
+    bookkeeping.
+    """
+    if isinstance(s, str) and isinstance(p, str):
+        if not (s.isascii() and p.isascii()):
+            return list(_iter_anagram_indices(s, p, defaultdict(int)))
+        s, p = s.encode("ascii"), p.encode("ascii")
+    return list(_iter_anagram_indices(s, p, [0] * 256))
+
+
+def _iter_anagram_indices(s, p, diff, base=0):
+    # diff is a defaultdict(int) for text or a zeroed 256-slot list for bytes; base is added to every yielded index
+    m = len(p)
+    if m == 0:
+        yield from range(base, base + len(s) + 1)
+        return
+
+    for c in p:
+        diff[c] += 1
+    mismatched = len(set(p))
+
+    for i, c in enumerate(s):
+        # c enters the window
+        d = diff[c]
+        if d == 0:
+            mismatched += 1
+        elif d == 1:
+            mismatched -= 1
+        diff[c] = d - 1
+
+        if i >= m:
+            # s[i - m] leaves the window
+            c = s[i - m]
+            d = diff[c]
+            if d == 0:
+                mismatched += 1
+            elif d == -1:
+                mismatched -= 1
+            diff[c] = d + 1
+
+        if mismatched == 0 and i >= m - 1:
+            yield base + i - m + 1
+
+
+def find_anagram_indices_multi(s: str, patterns) -> dict:
+    """
+    Find the anagram indices of many patterns with one scan of s per distinct pattern length.
+
+    Every character gets a random 64-bit weight and a window's hash is the sum of its weights, which does not depend on
+    the order of the characters and can be rolled in O(1) per step. Patterns are grouped by length and then by hash,
+    so one pass over s per length finds the candidate windows for all patterns of that length, and a Counter check
+    on each candidate rules out hash collisions. Anagrams of each other share one group. Returns a dict from
+    pattern to its sorted index list.
+    """
+    rng = random.Random(0)
+    weights = defaultdict(lambda: rng.getrandbits(64))
+    mask = (1 << 64) - 1
+
+    result = {p: [] for p in patterns}
+    by_length = defaultdict(dict)
+    for p in result:
+        if len(p) == 0:
+            result[p] = list(range(len(s) + 1))
+        elif len(p) <= len(s):
+            groups = by_length[len(p)].setdefault(sum(weights[c] for c in p) & mask, [])
+            p_count = Counter(p)
+            for count, members in groups:
+                if count == p_count:
+                    members.append(p)
+                    break
+            else:
+                groups.append((p_count, [p]))
+
+    for m, by_hash in by_length.items():
+        window = sum(weights[c] for c in s[:m]) & mask
+        for i in range(len(s) - m + 1):
+            if i:
+                window = (window + weights[s[i + m - 1]] - weights[s[i - 1]]) & mask
+            if window in by_hash:
+                s_count = Counter(s[i:i + m])
+                for count, members in by_hash[window]:
+                    if count == s_count:
+                        for p in members:
+                            result[p].append(i)
+    return result
+
+
+def iter_anagram_indices_file(source, p, chunk_size=1 << 20):
+    """
+    Lazily yield the byte offsets of the anagrams of p in a file, with bounded memory.
+
+    source is a path or a binary stream, p is bytes or an ASCII string and matching is done byte by byte. A path is
+    memory-mapped and scanned in place, so the OS pages the file in and out as needed. Streams, and files that cannot
+    be mapped, are read in chunks of chunk_size; the last len(p) - 1 bytes of each chunk are carried over to the
+    next one, which is exactly enough for windows crossing a chunk border and too short for a window to be reported
+    twice.
+    """
+    if isinstance(p, str):
+        p = p.encode("ascii")
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty files and special files cannot be mapped
+                yield from _iter_anagram_indices_chunked(f, p, chunk_size)
+                return
+            with mapped, memoryview(mapped) as view:
+                yield from _iter_anagram_indices(view, p, [0] * 256)
+    else:
+        yield from _iter_anagram_indices_chunked(source, p, chunk_size)
+
+
+def _iter_anagram_indices_chunked(stream, p, chunk_size):
+    overlap = max(len(p) - 1, 0)
+    tail = b""
+    base = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer = tail + chunk
+        if p:
+            yield from _iter_anagram_indices(buffer, p, [0] * 256, base)
+        else:
+            # every offset matches the empty pattern, the one after the last byte is yielded below
+            yield from range(base, base + len(buffer))
+        tail = buffer[-overlap:] if overlap else b""
+        base += len(buffer) - len(tail)
+    if not p:
+        yield base
+
+
+def benchmark(sizes_mb=(1, 4, 16), pattern_length=8):
+    rng = random.Random(0)
+    for size in sizes_mb:
+        s = "".join(rng.choices(string.ascii_lowercase[:6], k=size * 1024 * 1024))
+        p = s[1000:1000 + pattern_length]
+        timings = []
+        for func in (find_anagram_indices, find_anagram_indices_fast):
+            start = time.perf_counter()
+            indices = func(s, p)
+            timings.append(f"{func.__name__} {time.perf_counter() - start:.3f}s")
+        print(f"{size:>3} MB, {len(indices)} matches: " + "  ".join(timings))
+
+
+if __name__ == '__main__':
+    print(find_anagram_indices("cbaebabacd", "abc"))  # [0, 6]
+    print(find_anagram_indices_fast("cbaebabacd", "abc"))  # [0, 6]
+    print(find_anagram_indices_multi("cbaebabacd", ["abc", "ab", "ba", "e"]))
+    benchmark()
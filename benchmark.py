@@ -0,0 +1,308 @@
+# Benchmark every solver of the numbered problem modules and domino.py on growing generated inputs.
+#
+# The modules are imported with importlib (their names start with digits) and keep their demo code under
+# `if __name__ == '__main__':`, so importing them runs nothing. Every solver runs on every input size from 10^2 up
+# to --max-size, or up to its own limit in SOLVERS for the quadratic and pure Python ones. Each run records:
+# * seconds: best wall time of --repeat runs
+# * peak_bytes: peak traced memory of one extra run under tracemalloc
+# * retained_blocks: memory blocks still allocated after that run (sys.getallocatedblocks), result included. This is
+#   what the call leaves behind, not how many allocations it made: blocks allocated and freed during the call are not
+#   counted.
+#
+# The index classes (SortedWindowTracker, MaxSubarrayIndex) are timed on a build-plus-queries workload: the build
+# over n values, then n // 10 rounds of one update and one query, with the rounds generated outside the timing.
+# Generator solvers are drained. File-based solvers get their input written to a scratch directory by make_args, so
+# only the solver's own reading and writing is timed.
+#
+# The results are written as JSON. With --compare, a previous result file is loaded and every solver/size that got
+# slower by more than --threshold is reported, and the exit code is 1, so the script can guard against regressions.
+
+import argparse
+import functools
+import gc
+import importlib
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Solver:
+    module: str
+    function: str
+    make_args: Callable[[int, random.Random], tuple]
+    max_size: int = 10 ** 7
+    # called as workload(loaded object, *args) instead of calling the loaded object itself
+    workload: Optional[Callable] = None
+
+    @property
+    def name(self) -> str:
+        name = f"{self.module}.{self.function}"
+        return f"{name}[{self.workload.__name__.lstrip('_')}]" if self.workload else name
+
+
+def _int_list(n, rng):
+    return ([rng.randint(-100, 100) for _ in range(n)],)
+
+
+def _sign_list(n, rng):
+    return ([rng.choice((-1, 1)) for _ in range(n)],)
+
+
+def _nearly_sorted(n, rng):
+    arr = list(range(n))
+    for _ in range(3):
+        i, j = rng.randrange(n), rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return (arr,)
+
+
+def _text_and_pattern(n, rng):
+    s = "".join(rng.choices(string.ascii_lowercase[:6], k=n))
+    return s, s[n // 2:n // 2 + 8]
+
+
+def _words(n, rng):
+    # short words over three letters repeat a lot, so the number of pairs grows with n^2
+    return (["".join(rng.choices("abc", k=rng.randint(1, 10))) for _ in range(n)],)
+
+
+def _dominoes(n, rng):
+    # n values, i.e. n / 2 dominoes
+    return ([rng.randrange(max(n // 2, 1)) for _ in range(n)],)
+
+
+def _as_array(make_args):
+    return lambda n, rng: (np.array(make_args(n, rng)[0]),)
+
+
+def _rows(n, rng):
+    return (np.array([rng.randint(-100, 100) for _ in range(n)]).reshape(-1, min(n, 100)),)
+
+
+def _with_updates(make_args):
+    # adds n // 10 rounds of (index, value, l, r) to the arguments
+    def make(n, rng):
+        (arr,) = make_args(n, rng)
+        rounds = []
+        for _ in range(max(n // 10, 1)):
+            l, r = sorted((rng.randrange(n), rng.randrange(n)))
+            rounds.append((rng.randrange(n), rng.randint(-100, 100), l, r))
+        return arr, rounds
+    return make
+
+
+def _text_and_patterns(n, rng):
+    s, _ = _text_and_pattern(n, rng)
+    starts = [rng.randrange(max(n - 16, 1)) for _ in range(10)]
+    return s, [s[start:start + length] for start, length in zip(starts, (3, 3, 5, 5, 8, 8, 8, 12, 16, 16))]
+
+
+def _values_and_window(n, rng):
+    (values,) = _int_list(n, rng)
+    return values, min(n, 100)
+
+
+_scratch = None
+
+
+def _scratch_path(name):
+    # one temporary directory for the input and output files of a run, removed when the interpreter exits
+    global _scratch
+    if _scratch is None:
+        _scratch = tempfile.TemporaryDirectory(prefix="dcp-benchmark-")
+    return os.path.join(_scratch.name, name)
+
+
+def _sign_file(n, rng):
+    # raw int64 input file and output path for product_of_others_stream
+    (values,) = _sign_list(n, rng)
+    path = _scratch_path("signs.bin")
+    np.array(values, dtype=np.int64).tofile(path)
+    return path, _scratch_path("products.bin")
+
+
+def _text_file_and_pattern(n, rng):
+    s, p = _text_and_pattern(n, rng)
+    path = _scratch_path("text.txt")
+    with open(path, "w") as f:
+        f.write(s)
+    return path, p
+
+
+def _words_and_output(n, rng):
+    return _words(n, rng)[0], _scratch_path("pairs.txt")
+
+
+def _drain(generator_function, *args):
+    deque(generator_function(*args), maxlen=0)
+
+
+def _build_update_bounds(tracker_class, arr, rounds):
+    tracker = tracker_class(arr)
+    for i, value, _, _ in rounds:
+        tracker.update(i, value)
+        tracker.bounds()
+    return tracker
+
+
+def _build_update_query(index_class, arr, rounds):
+    index = index_class(arr)
+    for i, value, l, r in rounds:
+        index.update(i, value)
+        index.query(l, r)
+    return index
+
+
+SOLVERS = [
+    Solver("1_1_get_product_of_all_other_elements", "product_of_others", _sign_list),
+    Solver("1_1_get_product_of_all_other_elements", "product_of_others_batch", _as_array(_sign_list)),
+    Solver("1_1_get_product_of_all_other_elements", "product_of_others_stream", _sign_file),
+    Solver("1_2_locate_smallest_window_to_be_sorted", "smallest_window", _nearly_sorted),
+    Solver("1_2_locate_smallest_window_to_be_sorted", "smallest_window_parallel", _as_array(_nearly_sorted)),
+    Solver("1_2_locate_smallest_window_to_be_sorted", "SortedWindowTracker", _with_updates(_nearly_sorted), 10 ** 6,
+           _build_update_bounds),
+    Solver("1_3_calculate_max_subarray_sum", "max_subarray_sum", _int_list),
+    Solver("1_3_calculate_max_subarray_sum", "max_subarray_sum_wrapup", _int_list),
+    Solver("1_3_calculate_max_subarray_sum", "max_subarray_sum_indices", _int_list),
+    Solver("1_3_calculate_max_subarray_sum", "max_subarray_sum_batch", _rows),
+    Solver("1_3_calculate_max_subarray_sum", "MaxSubarrayIndex", _with_updates(_int_list), 10 ** 6,
+           _build_update_query),
+    Solver("1_4_number_of_smaller_elements_to_the_right", "smaller_numbers", _int_list, 10 ** 6),
+    Solver("1_4_number_of_smaller_elements_to_the_right", "smaller_numbers_bisect", _int_list, 10 ** 5),
+    Solver("1_4_number_of_smaller_elements_to_the_right", "smaller_numbers_fenwick", _int_list, 10 ** 6),
+    Solver("1_4_number_of_smaller_elements_to_the_right", "smaller_numbers_iterative", _int_list, 10 ** 6),
+    Solver("1_4_number_of_smaller_elements_to_the_right", "count_smaller", _int_list, 10 ** 6),
+    Solver("1_4_number_of_smaller_elements_to_the_right", "smaller_numbers_stream", _values_and_window, 10 ** 6,
+           _drain),
+    Solver("2_1_find_anagram_indices", "find_anagram_indices", _text_and_pattern, 10 ** 6),
+    Solver("2_1_find_anagram_indices", "find_anagram_indices_fast", _text_and_pattern),
+    Solver("2_1_find_anagram_indices", "find_anagram_indices_multi", _text_and_patterns),
+    Solver("2_1_find_anagram_indices", "iter_anagram_indices_file", _text_file_and_pattern, workload=_drain),
+    Solver("2_2_generate_palindrome_pairs", "palindrome_pairs", _words, 10 ** 3),
+    Solver("2_2_generate_palindrome_pairs", "palindrome_pairs_indexed", _words, 10 ** 4),
+    Solver("2_2_generate_palindrome_pairs", "palindrome_pairs_parallel", _words_and_output, 10 ** 4),
+    Solver("domino", "solution", _dominoes, 10 ** 5),
+    Solver("domino", "solution_union_find", _dominoes, 10 ** 6),
+    Solver("domino", "solution_numpy", _dominoes),
+]
+
+
+def load(solver: Solver) -> Callable:
+    func = getattr(importlib.import_module(solver.module), solver.function)
+    return functools.partial(solver.workload, func) if solver.workload else func
+
+
+def measure(func: Callable, args: tuple, repeat: int, memory: bool) -> dict:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    result = {"seconds": best}
+
+    if memory:
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        tracemalloc.start()
+        try:
+            output = func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_bytes"] = peak
+        result["retained_blocks"] = sys.getallocatedblocks() - blocks
+        del output
+    return result
+
+
+def run(max_size: int, repeat: int, memory: bool, only: Optional[str] = None, seed: int = 0) -> list[dict]:
+    sizes = []
+    size = 100
+    while size <= max_size:
+        sizes.append(size)
+        size *= 10
+
+    results = []
+    for solver in SOLVERS:
+        name = solver.name
+        if only and only not in name:
+            continue
+        func = load(solver)
+        for n in sizes:
+            if n > solver.max_size:
+                break
+            args = solver.make_args(n, random.Random(seed))
+            record = {"solver": name, "n": n, **measure(func, args, repeat, memory)}
+            print(f"{name:<80} n={n:>9}  {record['seconds']:.4f}s", file=sys.stderr)
+            results.append(record)
+    return results
+
+
+def find_regressions(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    previous = {(record["solver"], record["n"]): record["seconds"] for record in baseline}
+    regressions = []
+    for record in results:
+        before = previous.get((record["solver"], record["n"]))
+        if before and record["seconds"] > before * (1 + threshold):
+            regressions.append(
+                f"{record['solver']} n={record['n']}: {before:.4f}s -> {record['seconds']:.4f}s"
+            )
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark all problem solvers and write JSON results.")
+    parser.add_argument("--max-size", type=int, default=10 ** 7, help="largest input size, default 10^7")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size, the best one is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--only", help="only run solvers whose module.function contains this text")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated inputs")
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    parser.add_argument("--compare", help="previous JSON result file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown for --compare, default 20%%")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.repeat <= 0 or args.max_size < 100:
+        print("error: --repeat must be positive and --max-size at least 100", file=sys.stderr)
+        return 2
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": run(args.max_size, args.repeat, not args.no_memory, args.only, args.seed),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = find_regressions(report["results"], json.load(f)["results"], args.threshold)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
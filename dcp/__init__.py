@@ -0,0 +1,23 @@
+# Importable facade for the problem solvers in the repository root.
+#
+# The solver files start with digits, so they cannot be imported with a plain import statement. The submodules here
+# map readable names to them and load a solver file only when one of its names is first used:
+#
+#     from dcp.arrays import product_of_others
+#     import dcp; dcp.strings.find_anagram_indices_fast("cbaebabacd", "abc")
+#
+# Nothing is loaded by `import dcp` itself.
+
+import importlib
+
+__all__ = ["arrays", "strings", "graphs"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
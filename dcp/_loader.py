@@ -0,0 +1,47 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_solver_module(name):
+    """
+    Load ROOT/<name>.py once and register it in sys.modules under its own name.
+
+    Keeping the original name means a solver loaded here is the same module object as one imported with
+    importlib.import_module(name), and process pools can still pickle its functions by reference.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def lazy_exports(namespace, exports):
+    """
+    Build the module level __getattr__ and __dir__ for a facade module.
+
+    exports maps each public name to the solver module that defines it, or to a (module, attribute) pair when the
+    public name differs. The first access loads that module and caches the attribute in namespace, so later lookups
+    are plain global lookups.
+    """
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+        module, attribute = exports[name] if isinstance(exports[name], tuple) else (exports[name], name)
+        value = getattr(load_solver_module(module), attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,29 @@
+from dcp._loader import lazy_exports
+
+_PRODUCT = "1_1_get_product_of_all_other_elements"
+_WINDOW = "1_2_locate_smallest_window_to_be_sorted"
+_SUBARRAY = "1_3_calculate_max_subarray_sum"
+_SMALLER = "1_4_number_of_smaller_elements_to_the_right"
+
+_EXPORTS = {
+    "product_of_others": _PRODUCT,
+    "product_of_others_batch": _PRODUCT,
+    "product_of_others_stream": _PRODUCT,
+    "smallest_window": _WINDOW,
+    "smallest_window_parallel": _WINDOW,
+    "SortedWindowTracker": _WINDOW,
+    "max_subarray_sum": _SUBARRAY,
+    "max_subarray_sum_wrapup": _SUBARRAY,
+    "max_subarray_sum_indices": _SUBARRAY,
+    "max_subarray_sum_batch": _SUBARRAY,
+    "MaxSubarrayIndex": _SUBARRAY,
+    "smaller_numbers": _SMALLER,
+    "smaller_numbers_bisect": _SMALLER,
+    "smaller_numbers_fenwick": _SMALLER,
+    "smaller_numbers_iterative": _SMALLER,
+    "smaller_numbers_stream": _SMALLER,
+    "count_smaller": _SMALLER,
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -0,0 +1,10 @@
+from dcp._loader import lazy_exports
+
+_EXPORTS = {
+    "domino_solution": ("domino", "solution"),
+    "solution_union_find": "domino",
+    "solution_numpy": "domino",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
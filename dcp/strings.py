@@ -0,0 +1,19 @@
+from dcp._loader import lazy_exports
+
+_ANAGRAM = "2_1_find_anagram_indices"
+_PALINDROME = "2_2_generate_palindrome_pairs"
+
+_EXPORTS = {
+    "find_anagram_indices": _ANAGRAM,
+    "find_anagram_indices_fast": _ANAGRAM,
+    "find_anagram_indices_multi": _ANAGRAM,
+    "iter_anagram_indices_file": _ANAGRAM,
+    "is_palindrome": _PALINDROME,
+    "palindrome_pairs": _PALINDROME,
+    "palindrome_pairs_indexed": _PALINDROME,
+    "palindrome_pairs_parallel": _PALINDROME,
+    "PalindromeIndex": _PALINDROME,
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
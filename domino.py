@@ -1,6 +1,13 @@
 # you can write to stdout for debugging purposes, e.g.
 # print("this is a debug message")
 
+import random
+import time
+from array import array
+
+import numpy as np
+
+
 def solution(A):
     # Implement your solution here
 
@@ -88,6 +95,132 @@ def solution(A):
 
     return total_removal
 
-dominoes = [2, 4, 1, 3, 4, 6, 2, 4, 1, 6]
-print(solution(dominoes))  # Output: 3
+
+# same answer with a disjoint-set forest instead of BFS
+#
+# Two dominoes are connected when they share a value, so the components are the components of the graph whose nodes
+# are the values and whose edges are the dominoes. Values get dense ids, and parent/rank/occurrence counts live in
+# flat arrays; union by rank plus path halving keeps every find almost O(1), and there is no queue and no component
+# list. A value belongs to exactly one component, so the count of a value inside its component is just how often it
+# occurs, and one pass over the values gives every component's size and most common value.
+#
+# The swap check in solution can never change the answer: it only looks at counts[left] and counts[right], which are
+# never above the component's max count. So every component costs (2 * dominoes - max_count) // 2 removals.
+def solution_union_find(A):
+    ids = {}
+    parent = array('l')
+    rank = array('B')
+    occurrences = array('l')
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i in range(0, len(A) - 1, 2):
+        pair = []
+        for value in (A[i], A[i + 1]):
+            node = ids.get(value)
+            if node is None:
+                node = ids[value] = len(parent)
+                parent.append(node)
+                rank.append(0)
+                occurrences.append(0)
+            occurrences[node] += 1
+            pair.append(node)
+
+        a, b = find(pair[0]), find(pair[1])
+        if a != b:
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+
+    # per root: number of value occurrences (2 per domino) and the largest single value count
+    sizes = array('l', [0]) * len(parent)
+    max_counts = array('l', [0]) * len(parent)
+    for node in range(len(parent)):
+        root = find(node)
+        sizes[root] += occurrences[node]
+        if occurrences[node] > max_counts[root]:
+            max_counts[root] = occurrences[node]
+
+    return sum((size - max_count) // 2 for size, max_count in zip(sizes, max_counts) if size)
+
+
+# same answer again, array-at-a-time with NumPy
+#
+# np.unique turns the values into dense ids, and the components are found by label propagation over a union-find
+# style forest: every value starts as its own root, each round every domino whose two values still have different
+# roots hooks the larger root under the smaller one (np.minimum.at), and pointer jumping (labels = labels[labels])
+# flattens the forest again. It stops when no domino crosses two roots, at which point every value carries the
+# smallest id of its component.
+#
+# The count of a (component, value) key equals the count of the value, because a value never appears in two
+# components, so a bincount over the value ids already is the per-(component, value) table. Sorting the values by
+# label then gives each component a contiguous run, and add.reduceat / maximum.reduceat produce its size and max
+# count in one go.
+def solution_numpy(A):
+    A = np.asarray(A, dtype=np.int64)
+    A = A[:len(A) // 2 * 2]
+    if not len(A):
+        return 0
+
+    values, ids = np.unique(A, return_inverse=True)
+    left, right = ids[0::2], ids[1::2]
+
+    labels = np.arange(len(values))
+    while True:
+        left_labels, right_labels = labels[left], labels[right]
+        crossing = left_labels != right_labels
+        if not crossing.any():
+            break
+        # hook the larger root of every crossing domino onto the smaller one
+        np.minimum.at(
+            labels,
+            np.maximum(left_labels[crossing], right_labels[crossing]),
+            np.minimum(left_labels[crossing], right_labels[crossing]),
+        )
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+    occurrences = np.bincount(ids, minlength=len(values))
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+    starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+    sizes = np.add.reduceat(occurrences[order], starts)
+    max_counts = np.maximum.reduceat(occurrences[order], starts)
+    return int(((sizes - max_counts) // 2).sum())
+
+
+def benchmark(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), bfs_max_size=10 ** 5):
+    rng = random.Random(0)
+    for n in sizes:
+        # n dominoes with values drawn from n values, which gives a mix of small and giant components
+        A = [rng.randrange(n) for _ in range(2 * n)]
+        timings = []
+        for name, func in (
+            ("solution", solution),
+            ("solution_union_find", solution_union_find),
+            ("solution_numpy", solution_numpy),
+        ):
+            if func is solution and n > bfs_max_size:
+                continue
+            start = time.perf_counter()
+            result = func(A)
+            timings.append(f"{name} {time.perf_counter() - start:.3f}s")
+        print(f"{n:>8} dominoes, {result} removals: " + "  ".join(timings))
+
+
+if __name__ == '__main__':
+    dominoes = [2, 4, 1, 3, 4, 6, 2, 4, 1, 6]
+    print(solution(dominoes))  # Output: 3
+    print(solution_union_find(dominoes))  # Output: 3
+    print(solution_numpy(dominoes))  # Output: 3
+    benchmark()
 
@@ -0,0 +1,149 @@
+# Solve many independent domino sets with domino.py over a process pool.
+#
+# Input formats:
+# * jsonl: one JSON list of domino values per line, e.g. [2, 4, 1, 3]
+# * bin: a sequence of records, each a little-endian uint32 value count followed by that many int32 values
+#
+# The sets are read lazily and sent to the workers in chunks of --chunk-size sets. At most two chunks per worker are
+# in flight, so memory stays bounded on large inputs. Results are written one per line, in input order, and the
+# throughput is reported at the end.
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from domino import solution, solution_numpy, solution_union_find
+
+ENGINES = {
+    "bfs": solution,
+    "union_find": solution_union_find,
+    "numpy": solution_numpy,
+}
+RECORD_HEADER = struct.Struct("<I")
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_binary(path):
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header) < RECORD_HEADER.size:
+                raise ValueError(f"truncated record header in {path}")
+            (count,) = RECORD_HEADER.unpack(header)
+            values = array("i")
+            data = f.read(count * values.itemsize)
+            if len(data) < count * values.itemsize:
+                raise ValueError(f"truncated record in {path}")
+            values.frombytes(data)
+            if sys.byteorder != "little":
+                values.byteswap()
+            yield values.tolist()
+
+
+def write_binary(path, sets):
+    with open(path, "wb") as f:
+        for values in sets:
+            values = array("i", values)
+            if sys.byteorder != "little":
+                values.byteswap()
+            f.write(RECORD_HEADER.pack(len(values)))
+            f.write(values.tobytes())
+
+
+def read_sets(path, fmt="auto"):
+    if fmt == "auto":
+        fmt = "bin" if Path(path).suffix == ".bin" else "jsonl"
+    if fmt == "bin":
+        return read_binary(path)
+    if fmt == "jsonl":
+        return read_jsonl(path)
+    raise ValueError(f"unknown format: {fmt!r}")
+
+
+def _solve_chunk(engine, sets):
+    solve = ENGINES[engine]
+    return [solve(values) for values in sets], sum(len(values) // 2 for values in sets)
+
+
+def solve_batch(sets, output, workers=None, chunk_size=64, engine="union_find"):
+    """
+    Solve every set in sets, write one result per line to output in input order and return throughput stats.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine!r}")
+    workers = workers or os.cpu_count() or 1
+    sets = iter(sets)
+    set_count = domino_count = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(workers) as pool:
+        max_in_flight = 2 * workers
+        in_flight = deque()
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(sets, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(pool.submit(_solve_chunk, engine, chunk))
+            if not in_flight:
+                break
+            results, dominoes = in_flight.popleft().result()
+            output.write("".join(f"{result}\n" for result in results))
+            set_count += len(results)
+            domino_count += dominoes
+
+    seconds = time.perf_counter() - start
+    return {
+        "sets": set_count,
+        "dominoes": domino_count,
+        "seconds": seconds,
+        "sets_per_second": set_count / seconds if seconds else 0.0,
+        "dominoes_per_second": domino_count / seconds if seconds else 0.0,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Solve many domino sets in parallel.")
+    parser.add_argument("input", type=Path, help="input file, .jsonl or .bin")
+    parser.add_argument("output", type=Path, help="output file, one result per line in input order")
+    parser.add_argument("--format", choices=("auto", "jsonl", "bin"), default="auto", help="input format")
+    parser.add_argument("--workers", type=int, help="number of worker processes, default is the CPU count")
+    parser.add_argument("--chunk-size", type=int, default=64, help="sets per task sent to a worker")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="union_find", help="solver to use")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.chunk_size <= 0 or (args.workers is not None and args.workers <= 0):
+        print("error: --workers and --chunk-size must be positive", file=sys.stderr)
+        return 2
+
+    with open(args.output, "w") as output:
+        stats = solve_batch(read_sets(args.input, args.format), output, args.workers, args.chunk_size, args.engine)
+    print(
+        f"{stats['sets']} sets, {stats['dominoes']} dominoes in {stats['seconds']:.2f}s: "
+        f"{stats['sets_per_second']:.1f} sets/s, {stats['dominoes_per_second']:.1f} dominoes/s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
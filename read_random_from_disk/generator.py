@@ -0,0 +1,233 @@
+import os
+import random
+import string
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Linear-time engine behind test.py and test2.py.
+#
+# The layout rules are the ones of the original loops: after every source character the running character count c
+# (which includes markers and line breaks) is checked, "__c__" is appended when c is a multiple of number_interval,
+# and "\n" when c is a multiple of line_break_interval. Instead of checking after every character, layout() computes
+# how many characters are left until the next count that triggers anything and copies that whole run with one slice,
+# so the Python work is per marker, not per character. The output is streamed to the file in large buffered writes
+# and never held in memory as a whole. Line breaks are written as "\n" on every platform, like the parallel writer
+# below does, so the marker numbers of ASCII output are byte offsets.
+#
+# The letters come from an iterable of string blocks:
+# * random_letters(): blocks of random.randbytes mapped to A-Z/a-z with bytes.translate
+# * legacy_random_letters(): the exact per-character random calls of the old test.py, so a seeded run reproduces its
+#   output byte for byte (slow, but still linear)
+# * text_letters(): the characters of a text file, as test2.py does with the novel
+LETTERS = (string.ascii_uppercase + string.ascii_lowercase).encode('ascii')
+# bytes from 0 to 207 map onto the 52 letters 4 times each, 208 to 255 are dropped so every letter is equally likely
+_LETTER_TABLE = bytes(LETTERS[b % len(LETTERS)] for b in range(256))
+_DROPPED_BYTES = bytes(range(4 * len(LETTERS), 256))
+
+
+def layout(blocks, number_interval=100, line_break_interval=4000, char_count=0):
+    # yields the output text block by block, char_count is the output position of the first letter
+    for block in blocks:
+        pieces = []
+        position = 0
+        while position < len(block):
+            next_marker = (char_count // number_interval + 1) * number_interval
+            next_line_break = (char_count // line_break_interval + 1) * line_break_interval
+            run = min(next_marker, next_line_break) - char_count
+            take = min(run, len(block) - position)
+            pieces.append(block[position:position + take])
+            position += take
+            char_count += take
+            if take < run:
+                break
+
+            # char_count is what the original loop checked after adding the character
+            checked = char_count
+            if checked % number_interval == 0:
+                pieces.append("__" + str(checked) + "__")
+                char_count += len(str(checked)) + 4
+            if checked % line_break_interval == 0:
+                pieces.append("\n")
+                char_count += 1
+        yield "".join(pieces)
+
+
+def _random_letter_bytes(rng, size):
+    letters = b''
+    while len(letters) < size:
+        # about 19% of the bytes are dropped, ask for a little more than needed
+        letters += rng.randbytes((size - len(letters)) * 5 // 4 + 16).translate(_LETTER_TABLE, _DROPPED_BYTES)
+    return letters[:size]
+
+
+def random_letters(file_length, seed=None, block_size=1 << 20):
+    rng = random.Random(seed)
+    remaining = file_length
+    while remaining:
+        size = min(block_size, remaining)
+        remaining -= size
+        yield _random_letter_bytes(rng, size).decode('ascii')
+
+
+def legacy_random_letters(file_length, rng=random, block_size=1 << 16):
+    for start in range(0, file_length, block_size):
+        block = []
+        for _ in range(min(block_size, file_length - start)):
+            block.append(chr(rng.randint(65, 90)) if rng.random() < 0.5 else chr(rng.randint(97, 122)))
+        yield "".join(block)
+
+
+def text_letters(path, block_size=1 << 20):
+    with open(path, "r") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                return
+            yield block
+
+
+def write_marker_file(path, blocks, number_interval=100, line_break_interval=4000, buffer_size=1 << 22):
+    # returns the number of characters written
+    written = 0
+    with open(path, "w", buffering=buffer_size, newline="\n") as f:
+        for text in layout(blocks, number_interval, line_break_interval):
+            f.write(text)
+            written += len(text)
+    return written
+
+
+# Parallel generation of random marker files.
+#
+# When number_interval divides line_break_interval and every marker (plus its line break) is shorter than
+# number_interval, the layout is regular: the output is a row of blocks of number_interval characters, block k starts
+# at position k * number_interval with "__<k * number_interval>__" (and "\n" on multiples of line_break_interval),
+# and the rest of the block is letters. Block 0 has no marker. BlockLayout counts the letters before any block in
+# closed form, one term per number of marker digits, and finds the block where the letters run out by binary search,
+# so every region of the file can be laid out without looking at the regions before it.
+#
+# write_marker_file_parallel() preallocates the file and cuts it into regions of whole blocks. Each worker process
+# draws the letters of its region from its own random.Random seeded with "<seed>/<region>", lays them out with
+# layout() and writes them at the region's offset with os.pwrite. The output for a seed depends on region_size, but
+# not on the number of workers. Irregular layouts fall back to write_marker_file() with random_letters().
+class BlockLayout:
+    def __init__(self, file_length, number_interval=100, line_break_interval=4000):
+        if number_interval < 1 or line_break_interval % number_interval:
+            raise ValueError("line_break_interval must be a multiple of number_interval")
+        self.file_length = file_length
+        self.number_interval = number_interval
+        self.blocks_per_line = line_break_interval // number_interval
+
+        # markers up to max_digits digits leave at least one letter in their block
+        max_digits = number_interval - 6
+        if max_digits < 1:
+            block_limit = 0
+        elif max_digits > len(str((file_length + 1) * number_interval)):
+            block_limit = file_length + 1
+        else:
+            block_limit = (10 ** max_digits - 1) // number_interval
+
+        # the last block, the one whose letters include the last letter (or whose marker ends the file)
+        lo, hi = 0, min(file_length + 1, block_limit + 1)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.letters_before(mid) <= file_length:
+                lo = mid
+            else:
+                hi = mid - 1
+        if lo > block_limit:
+            raise ValueError(f"markers do not fit in blocks of {number_interval} characters")
+        self.last_block = lo
+        self.size = self.block_start(lo) + len(self.prefix(lo)) + file_length - self.letters_before(lo)
+
+    def block_start(self, k):
+        return k * self.number_interval
+
+    def prefix(self, k):
+        # marker and line break at the start of block k
+        if k == 0:
+            return ""
+        marker = "__" + str(k * self.number_interval) + "__"
+        return marker + "\n" if k % self.blocks_per_line == 0 else marker
+
+    def letters_before(self, k):
+        # letters in blocks 0 to k - 1
+        if k <= 0:
+            return 0
+        markers = k - 1
+        digits = 0
+        low = 1
+        while low <= markers * self.number_interval:
+            # markers k' * number_interval with as many digits as low
+            first = max(1, -(-low // self.number_interval))
+            last = min(markers, (low * 10 - 1) // self.number_interval)
+            if last >= first:
+                digits += len(str(low)) * (last - first + 1)
+            low *= 10
+        return k * self.number_interval - 4 * markers - digits - markers // self.blocks_per_line
+
+    def regions(self, region_size):
+        # (first block, end block, first byte, end byte) of every region, the regions cover the whole file
+        step = max(1, region_size // self.number_interval)
+        for first in range(0, self.last_block + 1, step):
+            end = min(first + step, self.last_block + 1)
+            end_byte = self.block_start(end) if end <= self.last_block else self.size
+            yield first, end, self.block_start(first), end_byte
+
+    def region_text(self, region, first, end, start_byte, end_byte, seed):
+        letter_count = min(self.letters_before(end), self.file_length) - self.letters_before(first)
+        rng = random.Random(f"{seed}/{region}")
+        letters = _random_letter_bytes(rng, letter_count).decode('ascii')
+        prefix = self.prefix(first)
+        text = prefix + "".join(layout([letters], self.number_interval, self.blocks_per_line * self.number_interval,
+                                       start_byte + len(prefix)))
+        # layout() also writes the marker of block end when the letters end right before it, that belongs to the
+        # next region
+        return text[:end_byte - start_byte]
+
+
+def _pwrite_all(fd, data, offset):
+    view = memoryview(data)
+    while view:
+        if hasattr(os, 'pwrite'):
+            written = os.pwrite(fd, view, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+def _write_region(path, block_layout, seed, region, bounds):
+    data = block_layout.region_text(region, *bounds, seed).encode('ascii')
+    fd = os.open(path, os.O_WRONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        _pwrite_all(fd, data, bounds[2])
+    finally:
+        os.close(fd)
+    return len(data)
+
+
+def write_marker_file_parallel(path, file_length, seed=None, number_interval=100, line_break_interval=4000,
+                               workers=None, region_size=1 << 24):
+    # returns the number of characters written
+    if seed is None:
+        seed = random.randrange(1 << 64)
+    try:
+        block_layout = BlockLayout(file_length, number_interval, line_break_interval)
+    except ValueError:
+        return write_marker_file(path, random_letters(file_length, seed), number_interval, line_break_interval)
+
+    with open(path, "wb") as f:
+        f.truncate(block_layout.size)
+    regions = block_layout.regions(region_size)
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        futures = [pool.submit(_write_region, path, block_layout, seed, region, bounds)
+                   for region, bounds in enumerate(regions)]
+        return sum(future.result() for future in futures)
+
+
+if __name__ == '__main__':
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    print(write_marker_file_parallel("random_file.txt", length, seed, workers=workers), "characters written")
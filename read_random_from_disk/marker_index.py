@@ -0,0 +1,162 @@
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+
+# Random access index for the files written by test.py / test2.py.
+#
+# One pass over the file records two tables, which are saved next to it as <file>.idx:
+# * checkpoints[k] is the byte offset of character k * stride, so a character position is one lookup plus decoding
+#   at most stride - 1 characters forward from that offset (none at all for ASCII text)
+# * the __N__ markers: their numbers in file order and the byte offset of each marker's first "_"
+#
+# The sidecar is a small header (magic, stride, the data file's size and mtime, table lengths) followed by the three
+# tables as raw int64 arrays, so loading it is a few reads and no parsing. The size and mtime let load_or_build
+# notice when the data file was regenerated and the index is stale.
+MAGIC = b'DCPMIDX1'
+HEADER = struct.Struct('<8sqqqqq')
+MARKER_RE = re.compile(rb'__(\d+)__')
+# longest marker we expect ("__" + 20 digits + "__"), kept back at chunk ends so a marker is never cut in two
+MARKER_TAIL = 24
+
+
+class MarkerIndex:
+    def __init__(self, stride, checkpoints, marker_numbers, marker_offsets, size=0, mtime_ns=0):
+        self.stride = stride
+        self.checkpoints = checkpoints
+        self.marker_numbers = marker_numbers
+        self.marker_offsets = marker_offsets
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    def byte_offset_for_position(self, position, data):
+        # data is the file content (bytes, mmap or memoryview), needed to decode forward from the checkpoint
+        if position < 0:
+            raise ValueError(f"negative position: {position}")
+        checkpoint = min(position // self.stride, len(self.checkpoints) - 1)
+        offset = self.checkpoints[checkpoint]
+        remaining = position - checkpoint * self.stride
+        if remaining <= 0:
+            return offset
+        if bytes(data[offset:offset + remaining]).isascii():
+            return min(offset + remaining, len(data))
+        while remaining and offset < len(data):
+            offset += 1
+            # skip UTF-8 continuation bytes, they do not start a character
+            while offset < len(data) and 0x80 <= data[offset] < 0xC0:
+                offset += 1
+            remaining -= 1
+        return offset
+
+    def byte_offset_for_marker(self, number):
+        # the marker number itself, or the closest marker before it when there is no marker with that number
+        i = bisect_right(self.marker_numbers, number)
+        if i == 0:
+            raise KeyError(f"no marker at or before {number}")
+        return self.marker_offsets[i - 1]
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.stride, self.size, self.mtime_ns,
+                                len(self.checkpoints), len(self.marker_numbers)))
+            for table in (self.checkpoints, self.marker_numbers, self.marker_offsets):
+                _little_endian(table).tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, stride, size, mtime_ns, checkpoint_count, marker_count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a marker index")
+            tables = []
+            for count in (checkpoint_count, marker_count, marker_count):
+                table = array('q')
+                table.fromfile(f, count)
+                tables.append(_little_endian(table))
+        return cls(stride, *tables, size=size, mtime_ns=mtime_ns)
+
+
+def _little_endian(table):
+    if sys.byteorder == 'little':
+        return table
+    swapped = array('q', table)
+    swapped.byteswap()
+    return swapped
+
+
+def build_index(path, stride=4096, chunk_size=1 << 22):
+    checkpoints = array('q')
+    marker_numbers = array('q')
+    marker_offsets = array('q')
+    chars = 0  # characters before the current chunk
+    offset = 0  # byte offset of the current chunk
+    pending = b''  # unsearched bytes carried over for the marker search, they end at offset
+
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+
+            # markers, searched in the carried bytes plus this chunk
+            buffer = pending + chunk
+            buffer_offset = offset - len(pending)
+            safe_end = len(buffer) if not chunk else max(len(buffer) - MARKER_TAIL, 0)
+            carry_from = safe_end
+            for match in MARKER_RE.finditer(buffer):
+                if match.end() > safe_end:
+                    # too close to the end to be sure it is complete, search it again with the next chunk
+                    carry_from = match.start()
+                    break
+                marker_numbers.append(int(match.group(1)))
+                marker_offsets.append(buffer_offset + match.start())
+                carry_from = max(safe_end, match.end())
+            pending = buffer[carry_from:]
+
+            if not chunk:
+                break
+
+            # character checkpoints
+            if chunk.isascii():
+                first = -(-chars // stride) * stride
+                checkpoints.extend(offset + c - chars for c in range(first, chars + len(chunk), stride))
+                chars += len(chunk)
+            else:
+                for i, byte in enumerate(chunk):
+                    if not 0x80 <= byte < 0xC0:
+                        if chars % stride == 0:
+                            checkpoints.append(offset + i)
+                        chars += 1
+            offset += len(chunk)
+
+    if not checkpoints or chars % stride == 0:
+        # the position right after the last character, which is also where an empty file starts
+        checkpoints.append(offset)
+    stat = os.stat(path)
+    return MarkerIndex(stride, checkpoints, marker_numbers, marker_offsets, stat.st_size, stat.st_mtime_ns)
+
+
+def load_or_build(path, stride=4096):
+    # reuse <path>.idx when it still matches the file, otherwise build and save a new one; when the sidecar cannot be
+    # written (read-only directory, full disk) the new index is only kept in memory
+    index_path = path + '.idx'
+    stat = os.stat(path)
+    try:
+        index = MarkerIndex.load(index_path)
+        if (index.size, index.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return index
+    except (OSError, ValueError, EOFError, struct.error):
+        pass
+    index = build_index(path, stride)
+    try:
+        index.save(index_path)
+    except OSError:
+        pass
+    return index
+
+
+if __name__ == '__main__':
+    for filename in sys.argv[1:] or ['random_file.txt']:
+        index = build_index(filename)
+        index.save(filename + '.idx')
+        print(f"{filename}: {len(index.checkpoints)} checkpoints, {len(index.marker_numbers)} markers")
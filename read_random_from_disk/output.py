@@ -1,22 +1,114 @@
-def read_file(filename):
-    with open(filename, 'r') as file:
-        return file.read()
-
-filename = 'random_file.txt'  # replace with the name of your file
-text = read_file(filename)
-position = 0
-default_n = 4096
-
-while True:
-    n = input("Enter the number of characters to display (default is 4k): ")
-    if not n:
-        n = default_n
-    else:
-        n = int(n)
-    if n == -1:
-        break
-    next_text = text[position:position+n]
-    next_preview = text[position+n:position+n+20]
-    print(next_text)
-    print("Preview to the next 20 characters:", next_preview)
-    position += n
\ No newline at end of file
+import codecs
+import mmap
+import os
+import sys
+
+from marker_index import load_or_build
+
+# The file is memory-mapped instead of read into one str, so opening it costs the same for 1 KB and for 100 GB and
+# only the pages that are actually shown are ever loaded. The position is a byte offset into the mapping. A page
+# decodes at most 4 bytes per character (the longest UTF-8 sequence) for the page and its preview together, so the
+# preview comes out of the same decode as the page. An incremental decoder holds back a character cut in half at the
+# end of that window, and the next page starts right after the last byte the page used.
+#
+# Undecodable bytes are kept as surrogates (surrogateescape), which keeps the byte count exact; they are shown as
+# replacement characters.
+#
+# "goto <position>" and "goto marker <N>" jump through the marker index (marker_index.py), which is built on first use
+# and kept next to the file as <file>.idx.
+MAX_UTF8_BYTES = 4
+
+
+class Pager:
+    def __init__(self, filename):
+        self.filename = filename
+        self._index = None
+        self._file = open(filename, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        # an empty file cannot be mapped
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self._view = memoryview(self._map)
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._view.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def seek(self, offset):
+        # move to offset, or to the next character start if offset points into the middle of a UTF-8 sequence
+        offset = max(0, min(offset, self.size))
+        while offset < self.size and 0x80 <= self._view[offset] < 0xC0:
+            offset += 1
+        self.position = offset
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = load_or_build(self.filename)
+        return self._index
+
+    def goto(self, position):
+        # jump to a character position
+        self.position = self.index.byte_offset_for_position(position, self._view)
+
+    def goto_marker(self, number):
+        # jump to the __number__ marker, or the last marker before it
+        self.position = self.index.byte_offset_for_marker(number)
+
+    def read(self, n, preview=20):
+        # returns the next n characters and the preview after them, and advances past the n characters
+        if n < 0 or preview < 0:
+            raise ValueError("cannot read a negative number of characters")
+        end = min(self.size, self.position + MAX_UTF8_BYTES * (n + preview))
+        decoder = codecs.getincrementaldecoder('utf-8')('surrogateescape')
+        text = decoder.decode(self._view[self.position:end], final=end == self.size)
+        page = text[:n]
+        self.position += len(page.encode('utf-8', 'surrogateescape'))
+        return page, text[n:n + preview]
+
+
+def printable(text):
+    return text.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+
+
+def main(filename):
+    default_n = 4096
+    with Pager(filename) as pager:
+        while True:
+            n = input("Enter the number of characters to display (default is 4k), "
+                      "or goto <position> / goto marker <N>: ")
+            words = n.split()
+            if words[:1] == ['goto']:
+                try:
+                    if words[1:2] == ['marker']:
+                        pager.goto_marker(int(words[2]))
+                    else:
+                        pager.goto(int(words[1]))
+                except (IndexError, ValueError, KeyError) as error:
+                    print("Cannot go there:", error)
+                continue
+            if not n:
+                n = default_n
+            else:
+                n = int(n)
+            if n == -1:
+                break
+            if n < 0:
+                print("Enter a positive number of characters, or -1 to quit")
+                continue
+            next_text, next_preview = pager.read(n)
+            print(printable(next_text))
+            print("Preview to the next 20 characters:", printable(next_preview))
+
+
+if __name__ == '__main__':
+    filename = sys.argv[1] if len(sys.argv) > 1 else 'random_file.txt'  # replace with the name of your file
+    main(filename)
@@ -0,0 +1,277 @@
+# Random read benchmark over a marker file written by generator.py (or test.py).
+#
+# Every combination of the chosen access patterns, block sizes, read methods and concurrency modes issues --reads
+# reads of one block each and records:
+# * iops and bytes_per_second: reads and bytes over the wall time of the run
+# * latency_us: percentiles of the time spent in each single read call
+#
+# Patterns: "sequential" reads consecutive blocks from the start of the file (wrapping around at the end), "random"
+# reads blocks at uniformly random byte offsets. Methods: "read" is lseek + read on a file descriptor of the calling
+# thread, "pread" is os.pread on one shared descriptor, "mmap" slices one shared read-only mapping. Modes: "single"
+# reads in the calling thread, "threads" from a pool of --threads threads, "asyncio" awaits asyncio.to_thread with at
+# most --threads reads in flight.
+#
+# Each block is checked against the file layout: in files from generator.py every marker __N__ starts at byte offset
+# N, so the first complete marker in a block read at offset o must be found at position N - o. A block without a
+# complete marker counts as unverified, a wrong marker or a short read as a mismatch, which makes the exit code 1. The
+# check runs outside the timed read call but inside the wall time; --no-verify skips it, and is needed for files
+# whose markers count characters that are not single bytes (test2.py with a non-ASCII text). Reads are served from
+# the page cache when the file is cached; --cold asks the kernel to drop the file's cached pages before every run.
+
+import argparse
+import asyncio
+import json
+import mmap
+import os
+import platform
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+PATTERNS = ("sequential", "random")
+METHODS = ("read", "pread", "mmap")
+MODES = ("single", "threads", "asyncio")
+DEFAULT_BLOCK_SIZES = "512,4K,64K,1M,4M"
+PERCENTILES = (50, 90, 99, 99.9)
+MARKER_RE = re.compile(rb'__(\d+)__')
+SIZE_SUFFIXES = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(text: str) -> int:
+    # "4096", "4K", "1M"
+    text = text.strip().upper().removesuffix("B")
+    number, suffix = (text[:-1], text[-1]) if text[-1:] in SIZE_SUFFIXES else (text, "")
+    size = int(number) * SIZE_SUFFIXES[suffix]
+    if size <= 0:
+        raise ValueError(f"block size must be positive: {text!r}")
+    return size
+
+
+def offsets(pattern: str, file_size: int, block_size: int, count: int, rng: random.Random) -> list[int]:
+    last = file_size - block_size
+    if pattern == "sequential":
+        blocks = last // block_size + 1
+        return [(i % blocks) * block_size for i in range(count)]
+    if pattern == "random":
+        return [rng.randint(0, last) for _ in range(count)]
+    raise ValueError(f"unknown pattern: {pattern!r}")
+
+
+def check_block(data: bytes, offset: int) -> Optional[bool]:
+    # True when the first marker matches its offset, False when it does not, None when there is no complete marker
+    match = MARKER_RE.search(data)
+    if match is None:
+        return None
+    return int(match.group(1)) == offset + match.start()
+
+
+class BlockReader:
+    def __init__(self, path: str, method: str):
+        if method not in METHODS:
+            raise ValueError(f"unknown method: {method!r}")
+        self.path = path
+        self.method = method
+        self._fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        self._local = threading.local()
+        self._thread_fds = []
+        self._lock = threading.Lock()
+        self._map = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ) if method == "mmap" else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        for fd in self._thread_fds + [self._fd]:
+            os.close(fd)
+        self._thread_fds = []
+
+    def drop_cache(self) -> None:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+    def _thread_fd(self) -> int:
+        # lseek + read moves the file position, so every thread gets its own descriptor
+        fd = getattr(self._local, "fd", None)
+        if fd is None:
+            fd = self._local.fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            with self._lock:
+                self._thread_fds.append(fd)
+        return fd
+
+    def read(self, offset: int, size: int) -> bytes:
+        if self.method == "pread":
+            return os.pread(self._fd, size, offset)
+        if self.method == "mmap":
+            return self._map[offset:offset + size]
+        fd = self._thread_fd()
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
+
+def _timed_read(reader: BlockReader, offset: int, size: int, verify: bool) -> tuple[float, int, Optional[bool]]:
+    start = time.perf_counter()
+    data = reader.read(offset, size)
+    latency = time.perf_counter() - start
+    if len(data) != size:
+        return latency, len(data), False
+    return latency, len(data), check_block(data, offset) if verify else None
+
+
+def _run_single(reader, block_offsets, size, verify, threads):
+    return [_timed_read(reader, offset, size, verify) for offset in block_offsets]
+
+
+def _run_threads(reader, block_offsets, size, verify, threads):
+    with ThreadPoolExecutor(threads) as pool:
+        return list(pool.map(lambda offset: _timed_read(reader, offset, size, verify), block_offsets))
+
+
+def _run_asyncio(reader, block_offsets, size, verify, threads):
+    async def read_all():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(threads))
+        slots = asyncio.Semaphore(threads)
+
+        async def read_one(offset):
+            async with slots:
+                return await asyncio.to_thread(_timed_read, reader, offset, size, verify)
+
+        return await asyncio.gather(*(read_one(offset) for offset in block_offsets))
+
+    return asyncio.run(read_all())
+
+
+RUNNERS = {
+    "single": _run_single,
+    "threads": _run_threads,
+    "asyncio": _run_asyncio,
+}
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    # nearest rank
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+def measure(reader: BlockReader, mode: str, block_offsets: list[int], size: int, verify: bool, threads: int,
+            cold: bool = False) -> dict:
+    if cold:
+        reader.drop_cache()
+    start = time.perf_counter()
+    reads = RUNNERS[mode](reader, block_offsets, size, verify, threads)
+    seconds = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _, _ in reads)
+    total_bytes = sum(length for _, length, _ in reads)
+    checks = [check for _, _, check in reads]
+    result = {
+        "reads": len(reads),
+        "bytes": total_bytes,
+        "seconds": seconds,
+        "iops": len(reads) / seconds if seconds else 0.0,
+        "bytes_per_second": total_bytes / seconds if seconds else 0.0,
+        "latency_us": {f"p{p:g}": percentile(latencies, p) * 1e6 for p in PERCENTILES},
+    }
+    result["latency_us"]["max"] = latencies[-1] * 1e6 if latencies else 0.0
+    if verify:
+        result["verified"] = checks.count(True)
+        result["unverified"] = checks.count(None)
+    # short reads are mismatches even without verification
+    result["mismatches"] = checks.count(False)
+    return result
+
+
+def run(path: str, patterns=PATTERNS, block_sizes=(512,), methods=METHODS, modes=MODES, reads: int = 1000,
+        threads: int = 8, verify: bool = True, cold: bool = False, seed: int = 0) -> list[dict]:
+    file_size = os.path.getsize(path)
+    if file_size == 0:
+        raise ValueError(f"{path} is empty")
+    results = []
+    for pattern in patterns:
+        for block_size in block_sizes:
+            size = min(block_size, file_size)
+            block_offsets = offsets(pattern, file_size, size, reads, random.Random(seed))
+            for method in methods:
+                with BlockReader(path, method) as reader:
+                    for mode in modes:
+                        record = {"pattern": pattern, "block_size": size, "method": method, "mode": mode,
+                                  **measure(reader, mode, block_offsets, size, verify, threads, cold)}
+                        print(f"{pattern:<10} {size:>8} {method:<5} {mode:<7} {record['iops']:>12.1f} IOPS "
+                              f"{record['bytes_per_second'] / (1 << 20):>10.1f} MiB/s", file=sys.stderr)
+                        results.append(record)
+    return results
+
+
+def _choices(text: str, allowed: tuple) -> list[str]:
+    values = [value.strip() for value in text.split(",") if value.strip()]
+    for value in values:
+        if value not in allowed:
+            raise argparse.ArgumentTypeError(f"{value!r} is not one of {', '.join(allowed)}")
+    return values
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark random reads from a generated marker file.")
+    parser.add_argument("path", nargs="?", default="random_file.txt", help="marker file, default random_file.txt")
+    parser.add_argument("--patterns", type=lambda text: _choices(text, PATTERNS), default=list(PATTERNS),
+                        help="comma separated: sequential,random")
+    parser.add_argument("--block-sizes", type=lambda text: [parse_size(size) for size in text.split(",")],
+                        default=DEFAULT_BLOCK_SIZES, help=f"comma separated, default {DEFAULT_BLOCK_SIZES}")
+    parser.add_argument("--methods", type=lambda text: _choices(text, METHODS), default=list(METHODS),
+                        help="comma separated: read,pread,mmap")
+    parser.add_argument("--modes", type=lambda text: _choices(text, MODES), default=list(MODES),
+                        help="comma separated: single,threads,asyncio")
+    parser.add_argument("--reads", type=int, default=1000, help="reads per combination, default 1000")
+    parser.add_argument("--threads", type=int, default=8, help="threads, or reads in flight for asyncio, default 8")
+    parser.add_argument("--no-verify", action="store_true", help="do not check the markers in the blocks read")
+    parser.add_argument("--cold", action="store_true", help="drop the file's cached pages before every run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random offsets")
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.reads <= 0 or args.threads <= 0:
+        print("error: --reads and --threads must be positive", file=sys.stderr)
+        return 2
+    if "pread" in args.methods and not hasattr(os, "pread"):
+        print("error: os.pread is not available on this platform", file=sys.stderr)
+        return 2
+
+    report = {
+        "file": args.path,
+        "file_size": os.path.getsize(args.path),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": run(args.path, args.patterns, args.block_sizes, args.methods, args.modes, args.reads,
+                       args.threads, not args.no_verify, args.cold, args.seed),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    mismatches = sum(record["mismatches"] for record in report["results"])
+    if mismatches:
+        print(f"error: {mismatches} blocks did not match the file layout", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
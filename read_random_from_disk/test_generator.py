@@ -0,0 +1,115 @@
+import os
+import random
+import re
+import tempfile
+import unittest
+
+from generator import (LETTERS, BlockLayout, layout, legacy_random_letters, random_letters, text_letters,
+                       write_marker_file, write_marker_file_parallel)
+
+
+def original_test_py(file_length, rng, number_interval=100, line_break_interval=4000):
+    # the loop of the old test.py, with the module level random calls on rng
+    file_content = ""
+    char_count = 0
+    for i in range(file_length):
+        rand_char = chr(rng.randint(65, 90)) if rng.random() < 0.5 else chr(rng.randint(97, 122))
+        file_content += rand_char
+        char_count += 1
+        number_length = 0
+        if char_count % number_interval == 0:
+            file_content += "__" + str(char_count) + "__"
+            number_length = len(str(char_count)) + 4
+            char_count += number_length
+        if (char_count - number_length) % line_break_interval == 0:
+            file_content += "\n"
+            char_count += 1
+    return file_content
+
+
+class GeneratorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "random_file.txt")
+
+    def test_legacy_letters_match_original_loop(self) -> None:
+        for length in (0, 1, 99, 100, 3999, 4000, 25000):
+            expected = original_test_py(length, random.Random(length))
+            written = write_marker_file(self.path, legacy_random_letters(length, random.Random(length), block_size=777))
+            with open(self.path, "rb") as f:
+                self.assertEqual(f.read(), expected.encode(), length)
+            self.assertEqual(written, len(expected))
+
+    def test_layout_other_intervals(self) -> None:
+        for number_interval, line_break_interval in ((7, 30), (10, 10), (100, 150), (1, 5)):
+            expected = original_test_py(3000, random.Random(1), number_interval, line_break_interval)
+            blocks = legacy_random_letters(3000, random.Random(1), block_size=123)
+            self.assertEqual("".join(layout(blocks, number_interval, line_break_interval)), expected)
+
+    def test_block_boundaries_do_not_change_layout(self) -> None:
+        letters = "".join(random_letters(10000, seed=2))
+        expected = "".join(layout([letters]))
+        for size in (1, 99, 100, 101, 4096):
+            blocks = [letters[i:i + size] for i in range(0, len(letters), size)]
+            self.assertEqual("".join(layout(blocks)), expected, size)
+
+    def test_random_letters(self) -> None:
+        letters = "".join(random_letters(50000, seed=3, block_size=1000))
+        self.assertEqual(len(letters), 50000)
+        self.assertEqual(set(letters), set(LETTERS.decode()))
+        self.assertEqual(letters, "".join(random_letters(50000, seed=3, block_size=1000)))
+        self.assertEqual(list(random_letters(0)), [])
+
+    def test_text_letters(self) -> None:
+        source = os.path.join(self.tmp.name, "novel.txt")
+        with open(source, "w") as f:
+            f.write("In my younger and more vulnerable years\n" * 300)
+        with open(source) as f:
+            text = f.read()
+        self.assertEqual("".join(text_letters(source, block_size=1000)), text)
+        self.assertEqual("".join(layout(text_letters(source, block_size=1000))), "".join(layout([text])))
+
+    def test_block_layout_matches_serial_layout(self) -> None:
+        for number_interval, line_break_interval in ((100, 4000), (12, 24), (7, 7)):
+            for length in list(range(0, 150)) + [399, 400, 12345]:
+                try:
+                    block_layout = BlockLayout(length, number_interval, line_break_interval)
+                except ValueError:
+                    continue
+                expected = "".join(layout(["a" * length], number_interval, line_break_interval))
+                self.assertEqual(block_layout.size, len(expected))
+                for region_size in (1, 3 * number_interval, 1 << 20):
+                    text = "".join(block_layout.region_text(region, *bounds, 0)
+                                   for region, bounds in enumerate(block_layout.regions(region_size)))
+                    self.assertEqual(re.sub("[A-Za-z]", "a", text), expected,
+                                     (number_interval, line_break_interval, length, region_size))
+
+    def test_block_layout_rejects_irregular_layouts(self) -> None:
+        with self.assertRaises(ValueError):
+            BlockLayout(1000, 100, 150)
+        with self.assertRaises(ValueError):
+            # "__10000__\n" fills a whole block of 10
+            BlockLayout(5000, 10, 40)
+
+    def test_parallel_file(self) -> None:
+        written = write_marker_file_parallel(self.path, 30000, seed=4, workers=2, region_size=2000)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        self.assertEqual(written, len(data))
+        self.assertEqual(re.sub(rb"[A-Za-z]", b"a", data), "".join(layout(["a" * 30000])).encode())
+        for match in re.finditer(rb"__(\d+)__", data):
+            self.assertEqual(int(match.group(1)), match.start())
+        self.assertEqual(write_marker_file_parallel(self.path, 30000, seed=4, workers=1, region_size=2000), written)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_parallel_falls_back_to_serial(self) -> None:
+        written = write_marker_file_parallel(self.path, 3000, seed=5, number_interval=100, line_break_interval=150)
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "".join(layout(random_letters(3000, 5), 100, 150)))
+        self.assertGreater(written, 3000)
+
+
+if __name__ == '__main__':
+    unittest.main()
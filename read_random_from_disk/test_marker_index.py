@@ -0,0 +1,108 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from marker_index import MarkerIndex, build_index, load_or_build
+from output import Pager
+
+
+def marker_file_text(length, rng, alphabet="abcXYZ"):
+    # same layout rules as test.py
+    content = []
+    char_count = 0
+    for _ in range(length):
+        content.append(rng.choice(alphabet))
+        char_count += 1
+        number_length = 0
+        if char_count % 100 == 0:
+            content.append("__" + str(char_count) + "__")
+            number_length = len(str(char_count)) + 4
+            char_count += number_length
+        if (char_count - number_length) % 4000 == 0:
+            content.append("\n")
+            char_count += 1
+    return "".join(content)
+
+
+class MarkerIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "random_file.txt")
+
+    def write(self, text: str) -> bytes:
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def check(self, text: str, data: bytes, index: MarkerIndex) -> None:
+        rng = random.Random(23)
+        for position in [0, len(text)] + [rng.randrange(len(text) + 1) for _ in range(200)]:
+            offset = index.byte_offset_for_position(position, data)
+            self.assertEqual(data[offset:].decode("utf-8"), text[position:], position)
+        for number, offset in zip(index.marker_numbers, index.marker_offsets):
+            self.assertTrue(data[offset:].startswith(f"__{number}__".encode()))
+
+    def test_ascii_file_with_small_chunks(self) -> None:
+        text = marker_file_text(20000, random.Random(24))
+        data = self.write(text)
+        index = build_index(self.path, stride=64, chunk_size=50)
+        self.assertEqual(len(index.marker_numbers), text.count("__") // 2)
+        self.check(text, data, index)
+        self.assertEqual(index.byte_offset_for_marker(100), text.index("__100__"))
+        self.assertEqual(index.byte_offset_for_marker(105), text.index("__100__"))
+        with self.assertRaises(KeyError):
+            index.byte_offset_for_marker(99)
+
+    def test_utf8_file(self) -> None:
+        text = marker_file_text(5000, random.Random(25), alphabet="aé中😀")
+        data = self.write(text)
+        self.check(text, data, build_index(self.path, stride=50, chunk_size=37))
+
+    def test_sidecar_round_trip_and_rebuild_when_stale(self) -> None:
+        self.write(marker_file_text(1000, random.Random(26)))
+        index = load_or_build(self.path, stride=128)
+        loaded = MarkerIndex.load(self.path + ".idx")
+        self.assertEqual(loaded.checkpoints, index.checkpoints)
+        self.assertEqual(loaded.marker_numbers, index.marker_numbers)
+        self.assertEqual(loaded.marker_offsets, index.marker_offsets)
+
+        text = marker_file_text(2000, random.Random(27))
+        self.write(text)
+        self.assertEqual(len(load_or_build(self.path, stride=128).marker_numbers), text.count("__") // 2)
+
+    def test_pager_goto(self) -> None:
+        text = marker_file_text(10000, random.Random(28))
+        self.write(text)
+        with Pager(self.path) as pager:
+            pager.goto(5000)
+            self.assertEqual(pager.read(10)[0], text[5000:5010])
+            pager.goto_marker(2000)
+            self.assertEqual(pager.read(10)[0], text[text.index("__2000__"):][:10])
+
+    def test_negative_position_is_rejected(self) -> None:
+        text = marker_file_text(10000, random.Random(29))
+        data = self.write(text)
+        index = build_index(self.path, stride=64)
+        with self.assertRaises(ValueError):
+            index.byte_offset_for_position(-5, data)
+        with Pager(self.path) as pager:
+            pager.goto(100)
+            with self.assertRaises(ValueError):
+                pager.goto(-5)
+            self.assertEqual(pager.position, 100)
+
+    def test_unwritable_sidecar_keeps_the_index_in_memory(self) -> None:
+        text = marker_file_text(2000, random.Random(30))
+        self.write(text)
+        with mock.patch.object(MarkerIndex, "save", side_effect=PermissionError("read-only directory")):
+            index = load_or_build(self.path, stride=128)
+        self.assertFalse(os.path.exists(self.path + ".idx"))
+        self.assertEqual(len(index.marker_numbers), text.count("__") // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
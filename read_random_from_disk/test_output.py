@@ -0,0 +1,65 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from output import Pager, main
+
+
+class PagerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "text.txt")
+
+    def write(self, text: str) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_pages_match_slicing_the_decoded_text(self) -> None:
+        rng = random.Random(22)
+        text = "".join(rng.choices("ab\né中😀", k=3000))
+        self.write(text)
+        with Pager(self.path) as pager:
+            position = 0
+            while position <= len(text):
+                n = rng.randint(1, 50)
+                page, preview = pager.read(n)
+                self.assertEqual(page, text[position:position + n])
+                self.assertEqual(preview, text[position + n:position + n + 20])
+                position += n
+
+    def test_seek_into_a_character_moves_to_the_next_one(self) -> None:
+        self.write("é中x")
+        with Pager(self.path) as pager:
+            pager.seek(1)
+            self.assertEqual(pager.read(1, preview=1), ("中", "x"))
+
+    def test_empty_file(self) -> None:
+        self.write("")
+        with Pager(self.path) as pager:
+            self.assertEqual(pager.read(10), ("", ""))
+
+    def test_negative_count_is_rejected(self) -> None:
+        self.write("abcdef")
+        with Pager(self.path) as pager:
+            pager.read(3)
+            with self.assertRaises(ValueError):
+                pager.read(-5)
+            self.assertEqual(pager.position, 3)
+
+    def test_main_asks_again_after_a_negative_count(self) -> None:
+        self.write("abcdef")
+        answers = iter(["-5", "2", "-1"])
+        output = io.StringIO()
+        with mock.patch("builtins.input", lambda prompt: next(answers)), contextlib.redirect_stdout(output):
+            main(self.path)
+        self.assertIn("Enter a positive number", output.getvalue())
+        self.assertIn("ab\n", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import random
+import tempfile
+import unittest
+
+from generator import write_marker_file_parallel
+from random_read_benchmark import BlockReader, check_block, offsets, parse_size, run
+
+
+class RandomReadBenchmarkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "random_file.txt")
+        write_marker_file_parallel(self.path, 50000, seed=6, workers=1)
+        with open(self.path, "rb") as f:
+            self.data = f.read()
+
+    def test_parse_size(self) -> None:
+        self.assertEqual(parse_size("512"), 512)
+        self.assertEqual(parse_size("4K"), 4096)
+        self.assertEqual(parse_size("4mb"), 4 << 20)
+        with self.assertRaises(ValueError):
+            parse_size("0")
+
+    def test_offsets(self) -> None:
+        self.assertEqual(offsets("sequential", 1000, 300, 5, random.Random(0)), [0, 300, 600, 0, 300])
+        for offset in offsets("random", 1000, 300, 100, random.Random(0)):
+            self.assertTrue(0 <= offset <= 700)
+
+    def test_check_block(self) -> None:
+        self.assertTrue(check_block(self.data[150:662], 150))
+        self.assertFalse(check_block(self.data[150:662], 151))
+        self.assertIsNone(check_block(self.data[110:150], 110))
+        # a marker cut at either end of the block is not used
+        start = self.data.index(b"__1300__")
+        self.assertIsNone(check_block(self.data[start + 1:start + 80], start + 1))
+        self.assertIsNone(check_block(self.data[start - 80:start + 5], start - 80))
+
+    def test_readers(self) -> None:
+        for method in ("read", "pread", "mmap"):
+            with BlockReader(self.path, method) as reader:
+                for offset in (0, 12345, len(self.data) - 512):
+                    self.assertEqual(reader.read(offset, 512), self.data[offset:offset + 512], method)
+
+    def test_run_all_combinations(self) -> None:
+        results = run(self.path, block_sizes=(512, 1 << 20), reads=40, threads=3)
+        self.assertEqual(len(results), 2 * 2 * 3 * 3)
+        for record in results:
+            self.assertEqual(record["mismatches"], 0, record)
+            self.assertEqual(record["verified"], 40, record)
+            self.assertEqual(record["bytes"], 40 * record["block_size"])
+            self.assertLessEqual(record["latency_us"]["p50"], record["latency_us"]["max"])
+        # the 1 MB blocks are cut to the size of the file
+        self.assertEqual(results[-1]["block_size"], len(self.data))
+
+    def test_run_reports_mismatches(self) -> None:
+        start = self.data.index(b"__1300__")
+        with open(self.path, "r+b") as f:
+            f.seek(start)
+            f.write(b"__1301__")
+        results = run(self.path, patterns=("sequential",), block_sizes=(100,), methods=("pread",),
+                      modes=("single",), reads=len(self.data) // 100)
+        self.assertEqual(results[0]["mismatches"], 1)
+        results = run(self.path, patterns=("sequential",), block_sizes=(100,), methods=("pread",),
+                      modes=("single",), reads=len(self.data) // 100, verify=False)
+        self.assertEqual(results[0]["mismatches"], 0)
+        self.assertNotIn("verified", results[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+import random
+import subprocess
+import sys
+import unittest
+
+import benchmark
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_importing_solver_modules_runs_no_demo_code(self) -> None:
+        # a fresh interpreter, so modules already imported by other tests do not hide the output
+        modules = sorted({solver.module for solver in benchmark.SOLVERS})
+        code = f"import importlib\nfor module in {modules!r}:\n    importlib.import_module(module)\n"
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(benchmark.__file__)),
+            capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(completed.stdout, "")
+
+    def test_every_solver_runs_on_the_smallest_size(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()):
+            results = benchmark.run(max_size=100, repeat=1, memory=True)
+        self.assertEqual(len(results), len(benchmark.SOLVERS))
+        for record in results:
+            self.assertGreaterEqual(record["peak_bytes"], 0)
+            self.assertIn("retained_blocks", record)
+        names = {record["solver"] for record in results}
+        self.assertIn("1_2_locate_smallest_window_to_be_sorted.SortedWindowTracker[build_update_bounds]", names)
+        self.assertIn("1_3_calculate_max_subarray_sum.MaxSubarrayIndex[build_update_query]", names)
+        for name in (
+            "1_1_get_product_of_all_other_elements.product_of_others_stream",
+            "1_4_number_of_smaller_elements_to_the_right.count_smaller",
+            "1_4_number_of_smaller_elements_to_the_right.smaller_numbers_stream[drain]",
+            "2_1_find_anagram_indices.find_anagram_indices_multi",
+            "2_1_find_anagram_indices.iter_anagram_indices_file[drain]",
+            "2_2_generate_palindrome_pairs.palindrome_pairs_parallel",
+        ):
+            self.assertIn(name, names)
+
+    def test_index_workloads_call_update_and_query(self) -> None:
+        calls = []
+
+        class Index:
+            def __init__(self, arr):
+                calls.append(("build", len(arr)))
+
+            def update(self, i, value):
+                calls.append("update")
+
+            def query(self, l, r):
+                calls.append("query")
+
+        solver = benchmark.Solver("m", "Index", benchmark._with_updates(benchmark._int_list),
+                                  workload=benchmark._build_update_query)
+        args = solver.make_args(50, random.Random(0))
+        solver.workload(Index, *args)
+        self.assertEqual(calls, [("build", 50)] + ["update", "query"] * 5)
+
+    def test_find_regressions(self) -> None:
+        baseline = [{"solver": "a", "n": 100, "seconds": 1.0}, {"solver": "b", "n": 100, "seconds": 1.0}]
+        results = [{"solver": "a", "n": 100, "seconds": 1.1}, {"solver": "b", "n": 100, "seconds": 1.5}]
+        self.assertEqual(benchmark.find_regressions(results, baseline, 0.2), ["b n=100: 1.0000s -> 1.5000s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
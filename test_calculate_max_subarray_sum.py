@@ -0,0 +1,68 @@
+import importlib
+import random
+import unittest
+
+import numpy as np
+
+solver = importlib.import_module("1_3_calculate_max_subarray_sum")
+
+
+def circular_sum(arr, start, end):
+    if start <= end:
+        return sum(arr[start:end + 1])
+    return sum(arr[start:]) + sum(arr[:end + 1])
+
+
+class MaxSubarraySumIndicesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(5)
+        self.rows = [[rng.randint(-10, 10) for _ in range(rng.randint(1, 15))] for _ in range(300)]
+
+    def test_sum_matches_kadane_and_indices_point_at_it(self) -> None:
+        for row in self.rows:
+            best, start, end = solver.max_subarray_sum_indices(row)
+            self.assertEqual(best, solver.max_subarray_sum(row))
+            self.assertEqual(sum(row[start:end + 1]), best)
+
+    def test_wrap_matches_wrapup_when_something_is_non_negative(self) -> None:
+        for row in self.rows:
+            best, start, end = solver.max_subarray_sum_indices(row, wrap=True)
+            self.assertEqual(circular_sum(row, start, end), best)
+            if max(row) >= 0:
+                self.assertEqual(best, solver.max_subarray_sum_wrapup(row))
+            else:
+                self.assertEqual(best, max(row))
+
+    def test_batch_matches_scalar_version(self) -> None:
+        for n in (1, 2, 7):
+            rows = [row[:n] for row in self.rows if len(row) >= n]
+            for wrap in (False, True):
+                sums, starts, ends = solver.max_subarray_sum_batch(np.array(rows), wrap=wrap)
+                expected = [solver.max_subarray_sum_indices(row, wrap) for row in rows]
+                self.assertEqual(list(zip(sums.tolist(), starts.tolist(), ends.tolist())), expected)
+
+
+class MaxSubarrayIndexTests(unittest.TestCase):
+    def test_range_queries_match_kadane_on_slices_after_updates(self) -> None:
+        rng = random.Random(6)
+        arr = [rng.randint(-10, 10) for _ in range(50)]
+        index = solver.MaxSubarrayIndex(arr)
+        for _ in range(300):
+            if rng.random() < 0.3:
+                i = rng.randrange(len(arr))
+                arr[i] = rng.randint(-10, 10)
+                index.update(i, arr[i])
+            l = rng.randrange(len(arr))
+            r = rng.randrange(l, len(arr))
+            self.assertEqual(index.query(l, r), solver.max_subarray_sum(arr[l:r + 1]))
+
+    def test_rejects_invalid_ranges(self) -> None:
+        index = solver.MaxSubarrayIndex([1, -2, 3])
+        with self.assertRaises(IndexError):
+            index.query(2, 1)
+        with self.assertRaises(IndexError):
+            index.query(0, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
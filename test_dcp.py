@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import dcp
+from dcp import arrays, graphs, strings
+
+
+class PackageFacadeTests(unittest.TestCase):
+    def test_names_resolve_to_the_solver_functions(self) -> None:
+        self.assertEqual(arrays.product_of_others([1, 2, 3, 4, 5]), [120, 60, 40, 30, 24])
+        self.assertEqual(arrays.smallest_window([3, 7, 5, 6, 9]), (1, 3))
+        self.assertEqual(strings.find_anagram_indices("cbaebabacd", "abc"), [0, 6])
+        self.assertEqual(graphs.domino_solution([2, 4, 1, 3, 4, 6, 2, 4, 1, 6]), 3)
+        self.assertIs(dcp.strings, strings)
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        with self.assertRaises(AttributeError):
+            arrays.no_such_solver
+        self.assertIn("count_smaller", dir(arrays))
+
+    def test_solver_files_load_on_first_use(self) -> None:
+        code = (
+            "import sys\n"
+            "from dcp import arrays\n"
+            "print('1_1_get_product_of_all_other_elements' in sys.modules, 'numpy' in sys.modules)\n"
+            "arrays.smallest_window\n"
+            "print('1_2_locate_smallest_window_to_be_sorted' in sys.modules,"
+            " '1_1_get_product_of_all_other_elements' in sys.modules)\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(completed.stdout.split(), ["False", "False", "True", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from domino import solution, solution_numpy, solution_union_find
+from domino_batch import read_sets, solve_batch, write_binary
+
+
+def random_dominoes(seed, count=300):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 30)
+        yield [rng.randint(1, rng.choice([3, 6, 40])) for _ in range(2 * n)]
+
+
+class DominoEngineTests(unittest.TestCase):
+    def test_example(self) -> None:
+        self.assertEqual(solution_union_find([2, 4, 1, 3, 4, 6, 2, 4, 1, 6]), 3)
+
+    def test_union_find_matches_bfs(self) -> None:
+        for A in random_dominoes(18):
+            self.assertEqual(solution_union_find(A), solution(A), A)
+
+    def test_numpy_matches_bfs(self) -> None:
+        for A in random_dominoes(19):
+            self.assertEqual(solution_numpy(A), solution(A), A)
+        self.assertEqual(solution_numpy([]), 0)
+
+    def test_numpy_handles_long_chains(self) -> None:
+        dominoes = [[i, i + 1] for i in range(2000)]
+        random.Random(20).shuffle(dominoes)
+        A = [value for domino in dominoes for value in domino]
+        self.assertEqual(solution_numpy(A), solution_union_find(A))
+
+
+class DominoBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sets = list(random_dominoes(21, count=50))
+        self.expected = "".join(f"{solution(A)}\n" for A in self.sets)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def solve(self, path: str) -> str:
+        output = io.StringIO()
+        stats = solve_batch(read_sets(path), output, workers=2, chunk_size=7)
+        self.assertEqual(stats["sets"], len(self.sets))
+        self.assertEqual(stats["dominoes"], sum(len(A) // 2 for A in self.sets))
+        return output.getvalue()
+
+    def test_jsonl_results_in_input_order(self) -> None:
+        path = os.path.join(self.tmp.name, "sets.jsonl")
+        with open(path, "w") as f:
+            f.writelines(json.dumps(A) + "\n" for A in self.sets)
+        self.assertEqual(self.solve(path), self.expected)
+
+    def test_binary_results_in_input_order(self) -> None:
+        path = os.path.join(self.tmp.name, "sets.bin")
+        write_binary(path, self.sets)
+        self.assertEqual(self.solve(path), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import importlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+solver = importlib.import_module("2_1_find_anagram_indices")
+
+
+def random_cases(seed, alphabet, count=200):
+    rng = random.Random(seed)
+    for _ in range(count):
+        s = "".join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        p = "".join(rng.choices(alphabet, k=rng.randint(0, 4)))
+        yield s, p
+
+
+class FindAnagramIndicesFastTests(unittest.TestCase):
+    def test_ascii_matches_counter_version(self) -> None:
+        for s, p in random_cases(11, "abc"):
+            self.assertEqual(solver.find_anagram_indices_fast(s, p), solver.find_anagram_indices(s, p))
+
+    def test_unicode_fallback_matches_counter_version(self) -> None:
+        for s, p in random_cases(12, "aé中"):
+            self.assertEqual(solver.find_anagram_indices_fast(s, p), solver.find_anagram_indices(s, p))
+
+    def test_bytes_input(self) -> None:
+        self.assertEqual(solver.find_anagram_indices_fast(b"cbaebabacd", b"abc"), [0, 6])
+
+
+class FindAnagramIndicesMultiTests(unittest.TestCase):
+    def test_matches_one_search_per_pattern(self) -> None:
+        rng = random.Random(13)
+        for _ in range(50):
+            s = "".join(rng.choices("abcé", k=rng.randint(0, 60)))
+            patterns = ["".join(rng.choices("abcé", k=rng.randint(0, 5))) for _ in range(10)]
+            result = solver.find_anagram_indices_multi(s, patterns)
+            self.assertEqual(result, {p: solver.find_anagram_indices(s, p) for p in patterns})
+
+    def test_anagram_patterns_share_matches(self) -> None:
+        result = solver.find_anagram_indices_multi("cbaebabacd", ["abc", "cab", "ab", "zz"])
+        self.assertEqual(result, {"abc": [0, 6], "cab": [0, 6], "ab": [1, 4, 5, 6], "zz": []})
+
+
+class IterAnagramIndicesFileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(14)
+        self.data = bytes(rng.choices(b"abcd", k=5000))
+
+    def expected(self, p: bytes) -> list:
+        return solver.find_anagram_indices(self.data.decode(), p.decode())
+
+    def test_chunked_stream_matches_in_memory_search(self) -> None:
+        for p in (b"a", b"ab", b"abcd", b"aabbc", b""):
+            for chunk_size in (1, 3, 64):
+                result = list(solver.iter_anagram_indices_file(io.BytesIO(self.data), p, chunk_size))
+                self.assertEqual(result, self.expected(p), (p, chunk_size))
+
+    def test_path_is_memory_mapped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.txt")
+            with open(path, "wb") as f:
+                f.write(self.data)
+            self.assertEqual(list(solver.iter_anagram_indices_file(path, "abc")), self.expected(b"abc"))
+
+            open(path, "wb").close()
+            self.assertEqual(list(solver.iter_anagram_indices_file(path, "abc")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
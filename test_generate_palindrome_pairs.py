@@ -0,0 +1,59 @@
+import importlib
+import os
+import random
+import tempfile
+import unittest
+
+solver = importlib.import_module("2_2_generate_palindrome_pairs")
+
+EXAMPLES = [
+    ["code", "edoc", "da", "d"],
+    ["abc", "cba", "xy", "yx", "x", "xx", "yy", ""],
+    ["bat", "tab", "cat"],
+]
+
+
+def random_word_lists(seed, count=300):
+    rng = random.Random(seed)
+    for _ in range(count):
+        # a tiny alphabet so palindromes, duplicates and empty words all show up
+        yield ["".join(rng.choices("ab", k=rng.randint(0, 4))) for _ in range(rng.randint(0, 8))]
+
+
+class PalindromePairsIndexedTests(unittest.TestCase):
+    def test_examples_match_brute_force(self) -> None:
+        for words in EXAMPLES:
+            self.assertEqual(solver.palindrome_pairs_indexed(words), solver.palindrome_pairs(words))
+
+    def test_random_words_match_brute_force(self) -> None:
+        for words in random_word_lists(15):
+            self.assertEqual(solver.palindrome_pairs_indexed(words), solver.palindrome_pairs(words), words)
+
+
+class PalindromeIndexTests(unittest.TestCase):
+    def test_answers_match_slicing(self) -> None:
+        rng = random.Random(16)
+        for _ in range(300):
+            word = "".join(rng.choices("aab", k=rng.randint(0, 12)))
+            index = solver.PalindromeIndex(word)
+            for i in range(len(word) + 1):
+                self.assertEqual(index.is_prefix_palindrome(i), solver.is_palindrome(word[:i]), (word, i))
+                self.assertEqual(index.is_suffix_palindrome(i), solver.is_palindrome(word[i:]), (word, i))
+                for j in range(i, len(word) + 1):
+                    self.assertEqual(index.is_palindrome(i, j), solver.is_palindrome(word[i:j]), (word, i, j))
+
+
+class PalindromePairsParallelTests(unittest.TestCase):
+    def test_output_file_holds_every_pair_once(self) -> None:
+        words = [w for words in random_word_lists(17, count=40) for w in words]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pairs.txt")
+            count = solver.palindrome_pairs_parallel(words, path, workers=2, shard_size=16)
+            with open(path) as f:
+                pairs = sorted([int(i), int(j)] for i, j in (line.split() for line in f))
+        self.assertEqual(pairs, solver.palindrome_pairs_indexed(words))
+        self.assertEqual(count, len(pairs))
+
+
+if __name__ == "__main__":
+    unittest.main()
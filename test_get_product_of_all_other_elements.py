@@ -0,0 +1,102 @@
+import importlib
+import math
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+solver = importlib.import_module("1_1_get_product_of_all_other_elements")
+
+
+class ProductOfOthersBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(1)
+        self.rows = [[self.rng.randint(-5, 5) for _ in range(12)] for _ in range(20)]
+
+    def test_int_mode_matches_loop_version_row_by_row(self) -> None:
+        result = solver.product_of_others_batch(np.array(self.rows), mode="int")
+        self.assertEqual(result.tolist(), [solver.product_of_others(row) for row in self.rows])
+
+    def test_axis_zero_matches_transposed_input(self) -> None:
+        arr = np.array(self.rows)
+        result = solver.product_of_others_batch(arr.T, axis=0, mode="int")
+        self.assertEqual(result.T.tolist(), solver.product_of_others_batch(arr, mode="int").tolist())
+
+    def test_handles_zeros_without_division(self) -> None:
+        rows = [[0, 2, 3, 4], [0, 2, 0, 4], [1, 2, 3, 0]]
+        self.assertEqual(
+            solver.product_of_others_batch(rows).tolist(),
+            [[24, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 6]],
+        )
+
+    def test_auto_mode_switches_to_exact_bigints_on_overflow(self) -> None:
+        row = [10 ** 6] * 8 + [3]
+        result = solver.product_of_others_batch([row])
+        self.assertEqual(result[0].tolist(), solver.product_of_others(row))
+
+    def test_log_mode_returns_sign_and_log_magnitude(self) -> None:
+        sign, log_abs = solver.product_of_others_batch([[2, -3, 0, 5]], mode="log")
+        self.assertEqual(sign.tolist(), [[0, 0, -1, 0]])
+        self.assertTrue(math.isclose(log_abs[0][2], math.log(30)))
+        self.assertEqual(log_abs[0][0], float("-inf"))
+
+    def test_ragged_list_returns_results_in_input_order(self) -> None:
+        arrays = [[1, 2, 3], [4, 5], [6, 7, 8], [9]]
+        result = solver.product_of_others_batch(arrays)
+        self.assertEqual([r.tolist() for r in result], [solver.product_of_others(a) for a in arrays])
+
+    def test_float_input_keeps_its_dtype(self) -> None:
+        result = solver.product_of_others_batch([[1.5, 2.0, 4.0]])
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result.tolist(), [solver.product_of_others([1.5, 2.0, 4.0])])
+
+    def test_ragged_list_of_2d_arrays_uses_stacked_axes(self) -> None:
+        arrays = [np.arange(1, 7).reshape(2, 3), np.arange(1, 9).reshape(2, 4), np.arange(2, 8).reshape(2, 3)]
+        for axis, member_axis in ((1, 0), (2, 1), (-1, -1), (-2, -2)):
+            result = solver.product_of_others_batch(arrays, axis=axis)
+            for a, r in zip(arrays, result):
+                self.assertEqual(r.tolist(), solver.product_of_others_batch(a, axis=member_axis).tolist(), axis)
+        for axis in (0, -3, 3):
+            with self.assertRaises(ValueError):
+                solver.product_of_others_batch(arrays, axis=axis)
+
+    def test_axis_zero_runs_across_a_list_of_equal_shape_arrays(self) -> None:
+        result = solver.product_of_others_batch([[1, 2], [3, 4]], axis=0)
+        self.assertEqual(result.tolist(), [[3, 4], [1, 2]])
+        self.assertEqual(solver.product_of_others_batch([[1, 2], [3, 4]], axis=1).tolist(), [[2, 1], [4, 3]])
+        self.assertEqual([r.tolist() for r in solver.product_of_others_batch([[1, 2], [3, 4, 5]], axis=1)],
+                         [[2, 1], [20, 15, 12]])
+        with self.assertRaises(ValueError):
+            solver.product_of_others_batch([[1, 2], [3, 4, 5]], axis=0)
+
+class ProductOfOthersStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        rng = random.Random(2)
+        self.values = [rng.choice([-2, -1, 0, 1, 1, 1, 2]) for _ in range(1000)]
+        self.expected = solver.product_of_others_batch([self.values], mode="int")[0].tolist()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def test_memmapped_input_file(self) -> None:
+        np.array(self.values, dtype=np.int64).tofile(self.path("in.bin"))
+        result = solver.product_of_others_stream(self.path("in.bin"), self.path("out.bin"), chunk_size=64)
+        self.assertEqual(result.tolist(), self.expected)
+        self.assertEqual(np.fromfile(self.path("out.bin"), dtype=np.int64).tolist(), self.expected)
+
+    def test_iterator_of_uneven_chunks(self) -> None:
+        chunks = (self.values[i:i + 97] for i in range(0, len(self.values), 97))
+        result = solver.product_of_others_stream(chunks, self.path("out.bin"))
+        self.assertEqual(result.tolist(), self.expected)
+
+    def test_empty_input(self) -> None:
+        result = solver.product_of_others_stream(iter([]), self.path("out.bin"))
+        self.assertEqual(result.tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import importlib
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+solver = importlib.import_module("1_2_locate_smallest_window_to_be_sorted")
+
+
+def random_arrays(seed, count=50):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(0, 60)
+        arr = sorted(rng.randint(-20, 20) for _ in range(n))
+        # disturb a few positions so there is usually, but not always, something to sort
+        for _ in range(rng.randint(0, 3)):
+            if n:
+                arr[rng.randrange(n)] = rng.randint(-20, 20)
+        yield arr
+
+
+class SmallestWindowParallelTests(unittest.TestCase):
+    def test_matches_sequential_version(self) -> None:
+        for arr in random_arrays(3):
+            with self.subTest(arr=arr):
+                self.assertEqual(solver.smallest_window_parallel(arr, workers=2), solver.smallest_window(arr))
+
+    def test_example_from_problem(self) -> None:
+        self.assertEqual(solver.smallest_window_parallel(np.array([3, 7, 5, 6, 9]), workers=2), (1, 3))
+
+    def test_python_ints_beyond_int64(self) -> None:
+        for arr in ([2 ** 70, 1, 2], [1, 2 ** 70, 2 ** 65, 2 ** 71], [-(2 ** 80), 0, 2 ** 80]):
+            with self.subTest(arr=arr):
+                self.assertEqual(solver.smallest_window_parallel(arr, workers=2), solver.smallest_window(arr))
+
+    def test_memmap_is_reopened_in_workers(self) -> None:
+        arr = list(range(1000))
+        arr[100], arr[900] = arr[900], arr[100]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "arr.bin")
+            np.array(arr, dtype=np.int32).tofile(path)
+            mapped = np.memmap(path, dtype=np.int32, mode="r")
+            self.assertEqual(solver.smallest_window_parallel(mapped, workers=3), (100, 900))
+            del mapped
+
+
+class SortedWindowTrackerTests(unittest.TestCase):
+    def test_matches_sequential_version_under_appends_and_updates(self) -> None:
+        rng = random.Random(4)
+        for arr in random_arrays(5, count=20):
+            tracker = solver.SortedWindowTracker(arr)
+            arr = list(arr)
+            for _ in range(40):
+                if arr and rng.random() < 0.5:
+                    i = rng.randrange(len(arr))
+                    arr[i] = rng.randint(-25, 25)
+                    tracker.update(i, arr[i])
+                else:
+                    arr.append(rng.randint(-25, 25))
+                    tracker.append(arr[-1])
+                self.assertEqual(tracker.values(), arr)
+                self.assertEqual(tracker.bounds(), solver.smallest_window(arr))
+
+    def test_sorted_appends_stay_sorted(self) -> None:
+        tracker = solver.SortedWindowTracker()
+        for value in range(100):
+            tracker.append(value)
+        self.assertIsNone(tracker.bounds())
+        tracker.update(50, -1)
+        self.assertEqual(tracker.bounds(), (0, 50))
+
+    def test_update_out_of_range(self) -> None:
+        with self.assertRaises(IndexError):
+            solver.SortedWindowTracker([1, 2]).update(2, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import importlib
+import random
+import unittest
+
+solver = importlib.import_module("1_4_number_of_smaller_elements_to_the_right")
+
+
+def random_lists(seed, count=200):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(0, 40)
+        # a small value range so duplicates are common
+        yield [rng.randint(-5, 5) for _ in range(n)]
+
+
+class SmallerNumbersEngineTests(unittest.TestCase):
+    def test_engines_match_merge_sort(self) -> None:
+        for nums in random_lists(7):
+            expected = solver.smaller_numbers(nums)
+            self.assertEqual(solver.smaller_numbers_bisect(nums), expected)
+            self.assertEqual(solver.smaller_numbers_fenwick(nums), expected)
+            self.assertEqual(solver.smaller_numbers_iterative(nums), expected)
+
+    def test_count_smaller_picks_every_engine(self) -> None:
+        nums = [5, 2, 6, 1, 2]
+        for engine in ("auto", *solver.ENGINES):
+            self.assertEqual(solver.count_smaller(nums, engine), [3, 1, 2, 0, 0])
+        with self.assertRaises(ValueError):
+            solver.count_smaller(nums, "quick")
+
+    def test_auto_uses_fenwick_above_threshold(self) -> None:
+        rng = random.Random(8)
+        nums = [rng.randrange(1000) for _ in range(solver.BISECT_MAX_SIZE + 1)]
+        self.assertEqual(solver.count_smaller(nums), solver.smaller_numbers(nums))
+
+    def test_iterative_merge_sort_handles_long_inputs_without_recursion(self) -> None:
+        nums = list(range(5000, 0, -1))
+        self.assertEqual(solver.smaller_numbers_iterative(nums), list(range(4999, -1, -1)))
+
+
+class SmallerNumbersStreamTests(unittest.TestCase):
+    def test_sliding_window_counts_the_next_window_minus_one_values(self) -> None:
+        rng = random.Random(9)
+        nums = [rng.randint(0, 50) for _ in range(3000)]
+        for window in (1, 2, 5, 700):
+            result = list(solver.smaller_numbers_stream(iter(nums), window))
+            expected = [(t, sum(x < nums[t] for x in nums[t + 1:t + window])) for t in range(len(nums))]
+            self.assertEqual(result, expected)
+
+    def test_sliding_window_larger_than_stream_matches_whole_list(self) -> None:
+        for nums in random_lists(10, count=50):
+            result = [count for _, count in solver.smaller_numbers_stream(nums, len(nums) + 1)]
+            self.assertEqual(result, solver.smaller_numbers(nums))
+
+    def test_tumbling_batches_are_independent(self) -> None:
+        nums = [5, 2, 6, 1, 2, 9, 3, 8]
+        result = list(solver.smaller_numbers_stream(nums, 3, mode="tumbling"))
+        self.assertEqual(result, [(0, 1), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 0), (7, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()